@@ -97,10 +97,25 @@ def _apply_dark_style(fig: plt.Figure, ax: plt.Axes) -> None:
     _apply_style(fig, ax, dark=True)
 
 
+# Fixed axes margins (figure fractions) per chart.  Setting them up front
+# replaces tight_layout / bbox_inches="tight", which each cost an extra
+# full draw to measure text extents.
+_DIST_MARGINS = {"left": 0.1, "right": 0.97, "top": 0.87, "bottom": 0.14}
+_WAFFLE_MARGINS = {"left": 0.04, "right": 0.96, "top": 0.86, "bottom": 0.04}
+_SUMMARY_MARGINS = {"left": 0.02, "right": 0.98, "top": 0.88, "bottom": 0.02}
+
+
 def _fig_to_bytes(fig: plt.Figure, dpi: int = 150) -> bytes:
-    """Render a matplotlib figure to PNG bytes."""
+    """Render a matplotlib figure to PNG bytes.
+
+    Uses zlib level 1: the PNG is an intermediate that QGIS decodes and
+    re-rasterizes on export, so stronger compression only costs CPU.
+    """
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", facecolor=fig.get_facecolor())
+    fig.savefig(
+        buf, format="png", dpi=dpi, facecolor=fig.get_facecolor(),
+        pil_kwargs={"compress_level": 1},
+    )
     plt.close(fig)
     buf.seek(0)
     return buf.read()
@@ -151,6 +166,7 @@ class ChartEngine:
     ) -> bytes:
         palette = _PALETTE if self.dark_theme else _PALETTE_LIGHT
         fig, ax = plt.subplots(figsize=(6, 3.5))
+        fig.subplots_adjust(**_DIST_MARGINS)
         _apply_style(fig, ax, self.dark_theme)
 
         if stats.histogram_bins and stats.histogram_counts:
@@ -192,7 +208,6 @@ class ChartEngine:
         ax.set_ylabel("Frequency", fontsize=10)
         ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:,.0f}"))
 
-        fig.tight_layout()
         return _fig_to_bytes(fig, self.dpi)
 
     def _distribution_plotly(
@@ -276,7 +291,15 @@ class ChartEngine:
         ]
 
         fig_height = max(4, len(items) * 0.35)
+        # Room for the longest 8pt tick label (~0.08 in per character)
+        longest = max((len(n) for n in names), default=0)
         fig, ax = plt.subplots(figsize=(7, fig_height))
+        fig.subplots_adjust(
+            left=min(0.45, (0.25 + 0.08 * longest) / 7.0),
+            right=0.96,
+            top=1.0 - 0.55 / fig_height,
+            bottom=0.4 / fig_height,
+        )
         _apply_style(fig, ax, self.dark_theme)
 
         y_pos = range(len(items))
@@ -297,7 +320,6 @@ class ChartEngine:
         ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:,.0f}"))
         ax.grid(axis="x", color=palette["grid"], linewidth=0.5, alpha=0.5)
 
-        fig.tight_layout()
         return _fig_to_bytes(fig, self.dpi)
 
     def _ranking_plotly(
@@ -374,6 +396,7 @@ class ChartEngine:
         remainder = 100 - pct
 
         fig, ax = plt.subplots(figsize=(3.5, 3.5))
+        fig.subplots_adjust(**_WAFFLE_MARGINS)
         fig.patch.set_facecolor(palette["bg"])
 
         wedges, _ = ax.pie(
@@ -404,7 +427,6 @@ class ChartEngine:
         if title:
             ax.set_title(title, fontsize=12, fontweight="bold", color=palette["text"], pad=16)
 
-        fig.tight_layout()
         return _fig_to_bytes(fig, self.dpi)
 
     # ------------------------------------------------------------------
@@ -434,6 +456,7 @@ class ChartEngine:
     ) -> bytes:
         palette = _PALETTE if self.dark_theme else _PALETTE_LIGHT
         fig, ax = plt.subplots(figsize=(5, 3))
+        fig.subplots_adjust(**_SUMMARY_MARGINS)
         fig.patch.set_facecolor(palette["bg"])
         ax.set_facecolor(palette["bg"])
         ax.axis("off")
@@ -476,5 +499,4 @@ class ChartEngine:
                 color=palette["text"], pad=20,
             )
 
-        fig.tight_layout()
         return _fig_to_bytes(fig, self.dpi)
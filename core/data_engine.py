@@ -7,12 +7,12 @@ contextual information for report generation.
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from qgis.core import QgsVectorLayer
+from qgis.core import QgsFeatureRequest, QgsVectorLayer
 
-from .models import FeatureContext, FieldStats, RankEntry
+from .models import FeatureContext, FieldStats, GraduatedMode, RankEntry
 
 
 class DataEngine:
@@ -34,6 +34,19 @@ class DataEngine:
         self._indicator_fields: List[str] = []
         self._data_cache: Dict[str, Dict[Any, float]] = {}
         self._names_cache: Dict[Any, str] = {}
+        # field → (feature IDs, values) in load order, built once per load
+        self._value_arrays: Dict[str, Tuple[List[Any], np.ndarray]] = {}
+        # Memoized per load: (field, num_bins) → stats, (field, asc) → ranking
+        self._stats_cache: Dict[Tuple[str, int], FieldStats] = {}
+        self._ranking_cache: Dict[Tuple[str, bool], List[RankEntry]] = {}
+        # field → (sorted values, mean, std, {feature_id: descending rank})
+        self._context_index: Dict[
+            str, Tuple[np.ndarray, float, float, Dict[Any, int]]
+        ] = {}
+        # (layer id, id field, name field, indicators) of the current
+        # caches; cleared when the layer's data or fields change
+        self._loaded_key: Optional[Tuple[str, str, str, Tuple[str, ...]]] = None
+        self._watched_layer: Optional[QgsVectorLayer] = None
 
     # ------------------------------------------------------------------
     # Loading
@@ -54,12 +67,19 @@ class DataEngine:
             name_field: Attribute field with display names.
             indicator_fields: List of numeric fields to analyze.
 
+        Reloading the same layer and fields is a no-op until the layer
+        reports changed data or fields.
+
         Raises:
             ValueError: If the layer is invalid or fields are missing.
         """
         if not layer or not layer.isValid():
             raise ValueError("Invalid or null vector layer.")
 
+        key = (layer.id(), id_field, name_field, tuple(indicator_fields))
+        if key == self._loaded_key and layer is self._layer:
+            return
+
         available_fields = {f.name() for f in layer.fields()}
         for fname in [id_field, name_field, *indicator_fields]:
             if fname not in available_fields:
@@ -68,6 +88,8 @@ class DataEngine:
                     f"Available: {sorted(available_fields)}"
                 )
 
+        self._loaded_key = None
+        self._watch(layer)
         self._layer = layer
         self._id_field = id_field
         self._name_field = name_field
@@ -76,11 +98,22 @@ class DataEngine:
         # Cache all data in a single pass for performance
         self._data_cache.clear()
         self._names_cache.clear()
+        self._value_arrays.clear()
+        self._stats_cache.clear()
+        self._ranking_cache.clear()
+        self._context_index.clear()
 
         for field_name in indicator_fields:
             self._data_cache[field_name] = {}
 
-        for feature in layer.getFeatures():
+        # Attributes only: skip geometry decoding and unused columns
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes(
+            [id_field, name_field, *indicator_fields], layer.fields()
+        )
+
+        for feature in layer.getFeatures(request):
             fid = feature[id_field]
             self._names_cache[fid] = str(feature[name_field])
             for field_name in indicator_fields:
@@ -91,11 +124,50 @@ class DataEngine:
                     except (ValueError, TypeError):
                         pass  # Skip non-numeric values silently
 
+        for field_name, values_dict in self._data_cache.items():
+            self._value_arrays[field_name] = (
+                list(values_dict),
+                np.fromiter(
+                    values_dict.values(), dtype=np.float64,
+                    count=len(values_dict),
+                ),
+            )
+        self._loaded_key = key
+
+    def _watch(self, layer: QgsVectorLayer) -> None:
+        """Invalidate the loaded caches when ``layer`` changes."""
+        if layer is self._watched_layer:
+            return
+        old = self._watched_layer
+        if old is not None:
+            try:
+                old.dataChanged.disconnect(self._invalidate)
+                old.updatedFields.disconnect(self._invalidate)
+            except (RuntimeError, TypeError):
+                pass  # layer already deleted
+        layer.dataChanged.connect(self._invalidate)
+        layer.updatedFields.connect(self._invalidate)
+        self._watched_layer = layer
+
+    def _invalidate(self) -> None:
+        """Force the next ``load`` to re-read the layer."""
+        self._loaded_key = None
+
     @property
     def feature_ids(self) -> List[Any]:
         """Return all cached feature IDs."""
         return list(self._names_cache.keys())
 
+    def feature_names(self, feature_ids: List[Any]) -> List[str]:
+        """Return display names aligned by position with ``feature_ids``.
+
+        IDs without a cached name fall back to ``str(fid)``.
+        """
+        names = self._names_cache
+        return [
+            names[fid] if fid in names else str(fid) for fid in feature_ids
+        ]
+
     @property
     def feature_count(self) -> int:
         """Return total number of features."""
@@ -113,7 +185,8 @@ class DataEngine:
             num_bins: Number of histogram bins.
 
         Returns:
-            FieldStats with all computed metrics.
+            FieldStats with all computed metrics (memoized until the next
+            ``load``).
 
         Raises:
             KeyError: If the field was not loaded.
@@ -124,8 +197,17 @@ class DataEngine:
                 f"Loaded fields: {list(self._data_cache.keys())}"
             )
 
-        values_dict = self._data_cache[field_name]
-        if not values_dict:
+        key = (field_name, num_bins)
+        cached = self._stats_cache.get(key)
+        if cached is None:
+            cached = self._compute_stats(field_name, num_bins)
+            self._stats_cache[key] = cached
+        return cached
+
+    def _compute_stats(self, field_name: str, num_bins: int) -> FieldStats:
+        """Uncached body of ``compute_stats``."""
+        arr = self._value_arrays[field_name][1]
+        if not len(arr):
             return FieldStats(
                 field_name=field_name,
                 count=0,
@@ -136,8 +218,6 @@ class DataEngine:
                 std=0.0,
             )
 
-        arr = np.array(list(values_dict.values()), dtype=np.float64)
-
         percentile_keys = [5, 10, 25, 50, 75, 90, 95]
         percentile_values = np.percentile(arr, percentile_keys).tolist()
         percentiles = dict(zip(percentile_keys, percentile_values))
@@ -157,6 +237,41 @@ class DataEngine:
             histogram_counts=counts.tolist(),
         )
 
+    def compute_class_breaks(
+        self, field_name: str, mode: GraduatedMode, classes: int
+    ) -> Optional[List[float]]:
+        """Compute graduated class breaks from the cached values.
+
+        Matches QGIS' quantile (Weibull, (n + 1) p positions, end points
+        clamped to the data range) and equal-interval classifications, so
+        the renderer need not re-scan the layer.
+
+        Args:
+            field_name: Indicator field to classify.
+            mode: Classification mode.
+            classes: Number of classes.
+
+        Returns:
+            ``classes + 1`` ascending bounds, or None when the mode is not
+            supported here (Jenks, Pretty) or the field has no values.
+        """
+        if field_name not in self._value_arrays or classes < 1:
+            return None
+        arr = self._value_arrays[field_name][1]
+        if not len(arr):
+            return None
+
+        if mode == GraduatedMode.QUANTILE:
+            bounds = np.quantile(
+                arr, np.linspace(0.0, 1.0, classes + 1), method="weibull"
+            )
+            bounds[0], bounds[-1] = arr.min(), arr.max()
+        elif mode == GraduatedMode.EQUAL_INTERVAL:
+            bounds = np.linspace(arr.min(), arr.max(), classes + 1)
+        else:
+            return None
+        return bounds.tolist()
+
     # ------------------------------------------------------------------
     # Ranking
     # ------------------------------------------------------------------
@@ -171,7 +286,8 @@ class DataEngine:
             ascending: If True, rank 1 = lowest value. If False, rank 1 = highest.
 
         Returns:
-            Sorted list of RankEntry.
+            Sorted list of RankEntry.  The list is memoized until the next
+            ``load`` and shared between callers: do not mutate it.
 
         Raises:
             KeyError: If the field was not loaded.
@@ -179,23 +295,76 @@ class DataEngine:
         if field_name not in self._data_cache:
             raise KeyError(f"Field '{field_name}' not loaded.")
 
-        values_dict = self._data_cache[field_name]
+        key = (field_name, ascending)
+        cached = self._ranking_cache.get(key)
+        if cached is None:
+            cached = self._compute_ranking(field_name, ascending)
+            self._ranking_cache[key] = cached
+        return cached
 
-        items = [
-            (fid, self._names_cache.get(fid, str(fid)), val)
-            for fid, val in values_dict.items()
-        ]
-        items.sort(key=lambda x: x[2], reverse=not ascending)
+    def _compute_ranking(
+        self, field_name: str, ascending: bool
+    ) -> List[RankEntry]:
+        """Uncached body of ``compute_ranking``."""
+        fids, arr = self._value_arrays[field_name]
+
+        # Stable, so ties keep load order in both directions
+        order = np.argsort(arr if ascending else -arr, kind="stable")
+        ranked_ids = [fids[i] for i in order.tolist()]
+        names = self.feature_names(ranked_ids)
 
         return [
             RankEntry(feature_id=fid, name=name, value=val, rank=i + 1)
-            for i, (fid, name, val) in enumerate(items)
+            for i, (fid, name, val) in enumerate(
+                zip(ranked_ids, names, arr[order].tolist())
+            )
         ]
 
+    def compute_stats_and_ranking(
+        self, field_name: str, ascending: bool = False, num_bins: int = 20
+    ) -> Tuple[FieldStats, List[RankEntry]]:
+        """Compute stats and ranking for a field in one call.
+
+        Both derive from the same cached column array; batch preparation
+        uses this single entry point instead of two lookups.
+
+        Args:
+            field_name: Indicator field.
+            ascending: Ranking direction (default: rank 1 = highest value).
+            num_bins: Number of histogram bins.
+
+        Returns:
+            ``(stats, ranking)``, both memoized until the next ``load``.
+
+        Raises:
+            KeyError: If the field was not loaded.
+        """
+        return (
+            self.compute_stats(field_name, num_bins),
+            self.compute_ranking(field_name, ascending),
+        )
+
     # ------------------------------------------------------------------
     # Feature context
     # ------------------------------------------------------------------
 
+    def _field_index(
+        self, field_name: str
+    ) -> Tuple[np.ndarray, float, float, Dict[Any, int]]:
+        """Build (once per load) the per-field lookup used by contexts."""
+        index = self._context_index.get(field_name)
+        if index is None:
+            values = np.sort(self._value_arrays[field_name][1])
+            mean = float(np.mean(values))
+            std = float(np.std(values, ddof=1)) if len(values) > 1 else 1.0
+            ranks = {
+                r.feature_id: r.rank
+                for r in self.compute_ranking(field_name, ascending=False)
+            }
+            index = (values, mean, std, ranks)
+            self._context_index[field_name] = index
+        return index
+
     def get_feature_context(
         self, feature_id: Any, field_name: str
     ) -> FeatureContext:
@@ -223,22 +392,18 @@ class DataEngine:
         value = values_dict[feature_id]
         name = self._names_cache.get(feature_id, str(feature_id))
 
-        # Compute position
-        all_values = np.array(list(values_dict.values()), dtype=np.float64)
-        mean = float(np.mean(all_values))
-        std = float(np.std(all_values, ddof=1)) if len(all_values) > 1 else 1.0
+        # Compute position against the cached sorted values
+        sorted_values, mean, std, ranks = self._field_index(field_name)
+        n = len(sorted_values)
 
         deviation = (value - mean) / std if std > 0 else 0.0
 
         # Percentile: % of values <= this value
-        percentile = float(np.sum(all_values <= value) / len(all_values) * 100)
+        below = int(np.searchsorted(sorted_values, value, side="right"))
+        percentile = float(below / n * 100)
 
         # Rank (descending — rank 1 = highest value)
-        ranking = self.compute_ranking(field_name, ascending=False)
-        rank = next(
-            (r.rank for r in ranking if r.feature_id == feature_id),
-            len(ranking),
-        )
+        rank = ranks.get(feature_id, n)
 
         return FeatureContext(
             feature_id=feature_id,
@@ -248,6 +413,7 @@ class DataEngine:
             total_features=len(values_dict),
             deviation_from_mean=round(deviation, 3),
             percentile=round(percentile, 1),
-            is_max=bool(value == float(np.max(all_values))),
-            is_min=bool(value == float(np.min(all_values))),
+            is_max=bool(value == float(sorted_values[-1])),
+            is_min=bool(value == float(sorted_values[0])),
         )
+
@@ -7,10 +7,12 @@ Python packages (pandas, plotly, kaleido) within QGIS's Python environment.
 from __future__ import annotations
 
 import importlib
+import re
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
 
 from qgis.PyQt.QtCore import QSettings
 
@@ -64,8 +66,21 @@ OPTIONAL_DEPENDENCIES: List[DependencyInfo] = [
     ),
 ]
 
+_DEPENDENCIES_BY_NAME: Dict[str, DependencyInfo] = {
+    dep.package_name: dep for dep in OPTIONAL_DEPENDENCIES
+}
+
 _SETTINGS_KEY = "AutoAtlasPro/dependency_prompt_dismissed"
 
+# pip progress lines parsed while a multi-package install streams
+_PIP_COLLECTING_RE = re.compile(r"^Collecting (\S+)")
+_PIP_INSTALLED_RE = re.compile(r"^Successfully installed (.+)$")
+
+
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution name the way pip compares them (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
 
 class DependencyManager:
     """Detects and installs optional Python packages in QGIS's environment."""
@@ -89,6 +104,30 @@ class DependencyManager:
         }
         return dict(self._status_cache)
 
+    def check_one(self, package_name: str) -> DepStatus:
+        """Re-check a single dependency and update the status cache.
+
+        Use after an install attempt instead of ``check_all``, which
+        probes every registered package.
+
+        Args:
+            package_name: pip name of a registered dependency.
+
+        Returns:
+            DepStatus.INSTALLED or DepStatus.MISSING.
+
+        Raises:
+            KeyError: If the package is not a registered dependency.
+        """
+        status = self._check_single(_DEPENDENCIES_BY_NAME[package_name])
+        self._status_cache[package_name] = status
+        return status
+
+    @property
+    def statuses(self) -> Dict[str, DepStatus]:
+        """Return the last known status of each dependency (no probing)."""
+        return dict(self._status_cache)
+
     @staticmethod
     def _check_single(dep: DependencyInfo) -> DepStatus:
         """Check whether a single dependency is importable.
@@ -160,21 +199,8 @@ class DependencyManager:
                 check=False,
             )
             if result.returncode == 0:
-                # Verify the import actually works now
                 importlib.invalidate_caches()
-                try:
-                    importlib.import_module(dep.import_name)
-                    self._status_cache[dep.package_name] = DepStatus.INSTALLED
-                    if progress_callback:
-                        progress_callback(f"✅ {dep.package_name} installed successfully")
-                    return DepStatus.INSTALLED
-                except ImportError:
-                    self._status_cache[dep.package_name] = DepStatus.ERROR
-                    if progress_callback:
-                        progress_callback(
-                            f"⚠️ {dep.package_name} installed but import failed"
-                        )
-                    return DepStatus.ERROR
+                return self._verify_import(dep, progress_callback)
             else:
                 self._status_cache[dep.package_name] = DepStatus.ERROR
                 if progress_callback:
@@ -194,6 +220,134 @@ class DependencyManager:
                 progress_callback(f"❌ {dep.package_name} error: {exc}")
             return DepStatus.ERROR
 
+    def install_many(
+        self,
+        deps: List[DependencyInfo],
+        progress_callback: Optional[Callable[[str], None]] = None,
+        status_callback: Optional[Callable[[str, DepStatus], None]] = None,
+    ) -> Dict[str, DepStatus]:
+        """Install several dependencies with a single pip invocation.
+
+        One pip run shares interpreter start-up, index lookups and the
+        resolver across all packages.  Its output is streamed line by line
+        so progress is reported while pip works.  If it fails, packages
+        pip did not report as installed are retried on their own so one
+        bad package cannot block the others.
+
+        Args:
+            deps: Dependencies to install.
+            progress_callback: Optional callable receiving status messages.
+            status_callback: Optional callable receiving
+                ``(package_name, DepStatus)`` as each package settles.
+
+        Returns:
+            Final status for each of ``deps``, keyed by package_name.
+        """
+        if not deps:
+            return {}
+
+        for dep in deps:
+            self._status_cache[dep.package_name] = DepStatus.INSTALLING
+        names = ", ".join(dep.package_name for dep in deps)
+        if progress_callback:
+            progress_callback(f"Installing {names}...")
+
+        installed: Set[str] = set()
+        try:
+            succeeded = self._run_pip_streaming(
+                self.get_install_many_command(deps, quiet=False),
+                timeout=300 * len(deps),
+                installed=installed,
+                progress_callback=progress_callback,
+            )
+        except Exception as exc:  # noqa: BLE001
+            succeeded = False
+            if progress_callback:
+                progress_callback(f"❌ {names} error: {exc}")
+
+        statuses: Dict[str, DepStatus] = {}
+        importlib.invalidate_caches()
+        for dep in deps:
+            if succeeded or _normalize_dist_name(dep.package_name) in installed:
+                status = self._verify_import(dep, progress_callback)
+            else:
+                # Partial failure: fall back to one pip run per package
+                status = self.install(dep, progress_callback)
+            statuses[dep.package_name] = status
+            if status_callback:
+                status_callback(dep.package_name, status)
+        return statuses
+
+    @staticmethod
+    def _run_pip_streaming(
+        cmd: List[str],
+        timeout: float,
+        installed: Set[str],
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> bool:
+        """Run pip, forwarding its output as it is produced.
+
+        Lines are read with blocking reads on the caller's (worker)
+        thread; a timer kills pip if it exceeds ``timeout`` seconds.
+
+        Args:
+            cmd: pip command line (not ``--quiet``, or nothing is parsed).
+            timeout: Seconds before the process is killed.
+            installed: Receives the normalized names pip reports as
+                successfully installed.
+            progress_callback: Optional callable receiving status messages.
+
+        Returns:
+            True if pip exited with status 0.
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        killer = threading.Timer(timeout, proc.kill)
+        killer.start()
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                match = _PIP_COLLECTING_RE.match(line)
+                if match:
+                    if progress_callback:
+                        progress_callback(f"Downloading {match.group(1)}...")
+                    continue
+                match = _PIP_INSTALLED_RE.match(line)
+                if match:
+                    installed.update(
+                        _normalize_dist_name(dist.rsplit("-", 1)[0])
+                        for dist in match.group(1).split()
+                    )
+            return proc.wait() == 0
+        finally:
+            killer.cancel()
+            proc.stdout.close()
+
+    def _verify_import(
+        self,
+        dep: DependencyInfo,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> DepStatus:
+        """Check that a freshly installed dependency actually imports."""
+        try:
+            importlib.import_module(dep.import_name)
+            self._status_cache[dep.package_name] = DepStatus.INSTALLED
+            if progress_callback:
+                progress_callback(f"✅ {dep.package_name} installed successfully")
+            return DepStatus.INSTALLED
+        except ImportError:
+            self._status_cache[dep.package_name] = DepStatus.ERROR
+            if progress_callback:
+                progress_callback(
+                    f"⚠️ {dep.package_name} installed but import failed"
+                )
+            return DepStatus.ERROR
+
     def install_all(
         self,
         progress_callback: Optional[Callable[[str], None]] = None,
@@ -206,9 +360,7 @@ class DependencyManager:
         Returns:
             Final status mapping for all dependencies.
         """
-        missing = self.get_missing()
-        for dep in missing:
-            self.install(dep, progress_callback)
+        self.install_many(self.get_missing(), progress_callback)
         return dict(self._status_cache)
 
     @staticmethod
@@ -265,30 +417,49 @@ class DependencyManager:
         Args:
             dep: Dependency metadata.
 
+        Returns:
+            Command as a list of strings suitable for subprocess.run.
+        """
+        return DependencyManager.get_install_many_command([dep])
+
+    @staticmethod
+    def get_install_many_command(
+        deps: List[DependencyInfo], quiet: bool = True
+    ) -> List[str]:
+        """Build one pip install command covering all ``deps``.
+
+        Args:
+            deps: Dependencies to install together.
+            quiet: Pass ``--quiet``; disable to parse pip's progress.
+
         Returns:
             Command as a list of strings suitable for subprocess.run.
         """
         python_path = DependencyManager._find_python()
-        pkg_spec = dep.package_name
-        if dep.max_version and dep.min_version == dep.max_version:
-            # Pin to exact version
-            pkg_spec = f"{dep.package_name}=={dep.max_version}"
-        elif dep.min_version and dep.max_version:
-            pkg_spec = f"{dep.package_name}>={dep.min_version},<={dep.max_version}"
-        elif dep.min_version:
-            pkg_spec = f"{dep.package_name}>={dep.min_version}"
         return [
             python_path,
             "-m",
             "pip",
             "install",
             "--user",
-            "--quiet",
+            *(("--quiet",) if quiet else ()),
             "--trusted-host", "pypi.org",
             "--trusted-host", "files.pythonhosted.org",
-            pkg_spec,
+            *(DependencyManager._pip_spec(dep) for dep in deps),
         ]
 
+    @staticmethod
+    def _pip_spec(dep: DependencyInfo) -> str:
+        """Return the pip requirement string for ``dep``."""
+        if dep.max_version and dep.min_version == dep.max_version:
+            # Pin to exact version
+            return f"{dep.package_name}=={dep.max_version}"
+        if dep.min_version and dep.max_version:
+            return f"{dep.package_name}>={dep.min_version},<={dep.max_version}"
+        if dep.min_version:
+            return f"{dep.package_name}>={dep.min_version}"
+        return dep.package_name
+
     # ------------------------------------------------------------------
     # UX gating
     # ------------------------------------------------------------------
@@ -26,6 +26,7 @@ from qgis.core import (
     QgsProject,
     QgsRectangle,
     QgsRendererCategory,
+    QgsRendererRange,
     QgsSingleSymbolRenderer,
     QgsStyle,
     QgsSymbol,
@@ -37,6 +38,16 @@ from qgis.PyQt.QtGui import QColor, QFont
 
 from .models import MapStyle, GraduatedMode
 
+_DEFAULT_STYLE: Optional[QgsStyle] = None
+
+
+def _default_style() -> QgsStyle:
+    """Return the QGIS default style, looking the singleton up once."""
+    global _DEFAULT_STYLE
+    if _DEFAULT_STYLE is None:
+        _DEFAULT_STYLE = QgsStyle.defaultStyle()
+    return _DEFAULT_STYLE
+
 
 class MapRenderer:
     """Renders thematic maps within a QgsPrintLayout.
@@ -66,6 +77,7 @@ class MapRenderer:
         single_color: str = "#3388FF",
         category_field: Optional[str] = None,
         opacity: float = 1.0,
+        breaks: Optional[List[float]] = None,
     ) -> None:
         """Apply the specified map style to the vector layer.
         
@@ -79,6 +91,8 @@ class MapRenderer:
             single_color: Hex color string for Single Symbol style.
             category_field: Specific field for Categorized style (optional override).
             opacity: Layer opacity (0.0 to 1.0).
+            breaks: Precomputed class bounds for Graduated style; when
+                given, QGIS does not re-scan the layer to classify.
         """
         layer.setOpacity(opacity)
         
@@ -86,7 +100,7 @@ class MapRenderer:
             self._apply_single_symbol(layer, single_color)
         elif style == MapStyle.GRADUATED:
             self._apply_graduated_symbol(
-                layer, field_name, graduated_mode, classes, color_ramp
+                layer, field_name, graduated_mode, classes, color_ramp, breaks
             )
         elif style == MapStyle.CATEGORIZED:
             # Use specific category field if provided, else fallback to indicator
@@ -110,12 +124,13 @@ class MapRenderer:
         mode: GraduatedMode,
         classes: int,
         ramp_name: str,
+        breaks: Optional[List[float]] = None,
     ) -> None:
         """Apply graduated symbol renderer using specified classification mode."""
         symbol = QgsSymbol.defaultSymbol(layer.geometryType())
-        ramp = QgsStyle.defaultStyle().colorRamp(ramp_name)
+        ramp = _default_style().colorRamp(ramp_name)
         if not ramp:
-            ramp = QgsStyle.defaultStyle().colorRamp("Spectral")
+            ramp = _default_style().colorRamp("Spectral")
 
         renderer = QgsGraduatedSymbolRenderer()
         renderer.setClassAttribute(field_name)
@@ -132,7 +147,16 @@ class MapRenderer:
             qgis_mode = QgsGraduatedSymbolRenderer.Pretty
             
         renderer.setMode(qgis_mode)
-        renderer.updateClasses(layer, classes)
+        if breaks and len(breaks) > 1:
+            method = renderer.classificationMethod()
+            for lower, upper in zip(breaks[:-1], breaks[1:]):
+                label = method.labelForRange(lower, upper) if method else ""
+                renderer.addClassRange(
+                    QgsRendererRange(lower, upper, symbol.clone(), label)
+                )
+            renderer.updateColorRamp(ramp)
+        else:
+            renderer.updateClasses(layer, classes)
         
         layer.setRenderer(renderer)
 
@@ -156,9 +180,9 @@ class MapRenderer:
             # Fallback for mixed types that cannot be sorted
             sorted_values = list(unique_values)
 
-        ramp = QgsStyle.defaultStyle().colorRamp(ramp_name)
+        ramp = _default_style().colorRamp(ramp_name)
         if not ramp and ramp_name != "Random":
-             ramp = QgsStyle.defaultStyle().colorRamp("Spectral")
+             ramp = _default_style().colorRamp("Spectral")
 
         for i, val in enumerate(sorted_values):
             symbol = QgsSymbol.defaultSymbol(layer.geometryType())
@@ -293,6 +317,28 @@ class MapRenderer:
         scale_bar.setStyle("Single Box")
         scale_bar.setNumberOfSegmentsLeft(0)
 
+        self.fit_scale_bar(scale_bar, map_item)
+
+        # ── Constrain physical height for compactness ──
+        scale_bar.setHeight(2.0)  # mm
+
+        # Style
+        scale_bar.setFont(QFont("Arial", 7))
+        scale_bar.setBackgroundEnabled(False)
+        scale_bar.setFrameEnabled(False)
+
+        layout.addLayoutItem(scale_bar)
+        return scale_bar
+
+    @staticmethod
+    def fit_scale_bar(
+        scale_bar: QgsLayoutItemScaleBar,
+        map_item: QgsLayoutItemMap,
+    ) -> None:
+        """Pick segment size and count for the linked map's current extent.
+
+        Called again whenever a reused map item is zoomed to a new feature.
+        """
         # ── Compute extent width in metres ──
         extent = map_item.extent()
         extent_width = extent.width()
@@ -333,17 +379,6 @@ class MapRenderer:
             scale_bar.setMapUnitsPerScaleBarUnit(1)
             scale_bar.setUnitLabel("m")
 
-        # ── Constrain physical height for compactness ──
-        scale_bar.setHeight(2.0)  # mm
-
-        # Style
-        scale_bar.setFont(QFont("Arial", 7))
-        scale_bar.setBackgroundEnabled(False)
-        scale_bar.setFrameEnabled(False)
-
-        layout.addLayoutItem(scale_bar)
-        return scale_bar
-
     def add_north_arrow(
         self,
         layout: QgsPrintLayout,
@@ -576,9 +611,9 @@ class MapRenderer:
         max_val = max(values)
         interval = (max_val - min_val) / num_classes if num_classes > 0 else 1.0
 
-        ramp = QgsStyle.defaultStyle().colorRamp(ramp_name)
+        ramp = _default_style().colorRamp(ramp_name)
         if not ramp:
-            ramp = QgsStyle.defaultStyle().colorRamp("Spectral")
+            ramp = _default_style().colorRamp("Spectral")
 
         alpha = int(opacity * 255)
         ranges = []
@@ -65,6 +65,7 @@ class OutputFormat(Enum):
 
     PDF = auto()
     PNG = auto()
+    PDF_MULTIPAGE = auto()  # one PDF, one page per feature
 
 
 class DepStatus(Enum):
@@ -221,10 +222,18 @@ class ReportConfig:
         color_ramp_name: Name of the QGIS color ramp.
         chart_types: Which charts to include in each report page.
         template: Template layout configuration.
-        output_format: PDF or PNG.
+        output_format: PDF, PNG, or a single multi-page PDF.
         output_dir: Directory to write report files.
         dpi: Resolution for rendered outputs.
         feature_ids: Optional subset of feature IDs to generate (None = all).
+        gc_every: Fallback interval (in reports) for a full garbage
+            collection when memory growth cannot be measured.
+        shard_output: Write each report into a sub-directory named after
+            the first two characters of its filename, keeping directory
+            sizes bounded for very large atlases.
+        schedule_by_locality: Generate reports in Morton (Z-order) of the
+            feature centres so neighbouring units render consecutively and
+            reuse cached base map tiles.
     """
 
     layer_id: str
@@ -272,6 +281,10 @@ class ReportConfig:
     logo_position: str = "Right"
     header_color: str = "#1B2838"
     footer_color: str = "#1B2838"
+    # Performance tuning
+    gc_every: int = 50
+    shard_output: bool = False
+    schedule_by_locality: bool = False
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -281,6 +294,8 @@ class ReportConfig:
             raise ValueError("At least one indicator field is required.")
         if self.dpi < 72 or self.dpi > 1200:
             raise ValueError(f"DPI must be between 72 and 1200, got {self.dpi}.")
+        if self.gc_every < 1:
+            raise ValueError(f"gc_every must be at least 1, got {self.gc_every}.")
             
         # Strict Hex Color Validation
         hex_pattern = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
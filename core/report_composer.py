@@ -8,12 +8,19 @@ and yields control to the event loop between reports to keep QGIS responsive.
 from __future__ import annotations
 
 import gc
+import logging
 import os
-import tempfile
+import re
+import socket
+import time
+import urllib.request
+from contextlib import contextmanager
 from datetime import datetime
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.error import URLError
 from urllib.parse import quote
 
 from qgis.core import (
@@ -21,25 +28,44 @@ from qgis.core import (
     QgsCoordinateReferenceSystem,
     QgsCoordinateTransform,
     QgsFeatureRequest,
+    QgsGeometry,
     QgsLayoutExporter,
     QgsLayoutItemLabel,
     QgsLayoutItemLegend,
     QgsLayoutItemMap,
     QgsLayoutItemPicture,
+    QgsLayoutItemScaleBar,
     QgsLayoutItemShape,
     QgsLayoutMeasurement,
     QgsLayoutPoint,
+    QgsLayoutRenderContext,
     QgsLayoutSize,
     QgsPrintLayout,
     QgsProject,
     QgsRasterLayer,
     QgsRectangle,
     QgsVectorLayer,
+    QgsVectorSimplifyMethod,
+)
+from qgis.PyQt.QtCore import QEventLoop, QMarginsF, QSize, QSizeF, Qt
+from qgis.PyQt.QtGui import (
+    QColor,
+    QFont,
+    QImage,
+    QPageSize,
+    QPainter,
+    QPdfWriter,
 )
-from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtGui import QColor, QFont
 from qgis.PyQt.QtWidgets import QApplication
 
+_HAS_PSUTIL = False
+try:
+    import psutil
+
+    _HAS_PSUTIL = True
+except ImportError:
+    pass
+
 from .chart_engine import ChartEngine
 from .data_engine import DataEngine
 from .map_renderer import MapRenderer
@@ -113,6 +139,32 @@ _BASE_MAP_URLS: Dict[BaseMapType, Tuple[str, str, str]] = {
     ),
 }
 
+# Provider URIs and reachability-probe URLs, built once at import.
+# Protocol chars (/:?=) are preserved but '&' MUST become '%26'.
+_BASE_MAP_URIS: Dict[BaseMapType, str] = {
+    bm: f"type=xyz&url={quote(url, safe='/:?=')}&zmax={zmax}&zmin={zmin}"
+    for bm, (url, zmax, zmin) in _BASE_MAP_URLS.items()
+}
+_BASE_MAP_PROBES: Dict[BaseMapType, str] = {
+    bm: url.format(z="0", x="0", y="0", q="0")
+    for bm, (url, _zmax, _zmin) in _BASE_MAP_URLS.items()
+}
+
+# Provider → monotonic time of its last successful probe.  Tiles themselves
+# are already shared across features and batches by QGIS' network cache;
+# this only spares repeat batches/previews the blocking reachability ping.
+_BASE_MAP_REACHABLE: Dict[BaseMapType, float] = {}
+_BASE_MAP_PROBE_TTL_S = 300.0
+
+# Characters not allowed in output filenames (word chars, space, . and - are)
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w .\-]")
+
+# Minimum seconds between event-loop yields during a batch.  Exports take
+# far longer than a frame, so yielding on every feature only buys repaints.
+_YIELD_INTERVAL_S = 0.25
+
+_log = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Default template — Premium layout (A4 Landscape)
 # ---------------------------------------------------------------------------
@@ -140,6 +192,119 @@ _DEFAULT_TEMPLATE = TemplateConfig(
 )
 
 
+def _spread_bits(v: int) -> int:
+    """Insert a zero bit between each of the low 16 bits of ``v``."""
+    v &= 0xFFFF
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def _morton_code(x: int, y: int) -> int:
+    """Interleave two 16-bit grid coordinates into a 32-bit Z-order code."""
+    return _spread_bits(x) | (_spread_bits(y) << 1)
+
+
+# ---------------------------------------------------------------------------
+# Garbage-collection policy for long batches
+# ---------------------------------------------------------------------------
+
+class GcPolicy:
+    """Decide when a garbage collection is worth its cost.
+
+    With the optional ``psutil``, collects the young generations only once
+    resident memory has grown by ``GROWTH_FACTOR`` since the last
+    collection.  Without it, memory cannot be measured and a full
+    collection runs every ``every`` reports instead.
+    """
+
+    GROWTH_FACTOR = 1.5
+
+    def __init__(self, every: int = 50) -> None:
+        self.every = max(1, every)
+        self._process = psutil.Process() if _HAS_PSUTIL else None
+        self._baseline = 0
+
+    def _rss(self) -> int:
+        """Current resident set size in bytes (0 when unavailable)."""
+        return self._process.memory_info().rss if self._process else 0
+
+    def step(self, index: int) -> bool:
+        """Record that report ``index`` finished; collect if warranted.
+
+        Returns:
+            True if a collection ran.
+        """
+        if self._process is None:
+            # No memory readings: fall back to a fixed cadence
+            if index > 0 and index % self.every == 0:
+                gc.collect()
+                return True
+            return False
+        rss = self._rss()
+        if not self._baseline:
+            self._baseline = rss
+            return False
+        if rss > self._baseline * self.GROWTH_FACTOR:
+            gc.collect(1)
+            self._baseline = self._rss()
+            return True
+        return False
+
+    @staticmethod
+    @contextmanager
+    def paused() -> Iterator[None]:
+        """Suspend automatic generational collection for one report.
+
+        Layout building and export allocate many short-lived wrappers;
+        skipping gen0 sweeps there leaves reclamation to ``step``.
+        """
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            yield
+        finally:
+            if was_enabled:
+                gc.enable()
+
+
+@dataclass
+class _LayoutSkeleton:
+    """Feature-independent layout items reused across a batch."""
+
+    config: ReportConfig
+    template: TemplateConfig
+    layer: QgsVectorLayer
+    base_layer: Optional[QgsRasterLayer]
+    layout: QgsPrintLayout
+    title_item: QgsLayoutItemLabel
+    map_item: QgsLayoutItemMap
+    map_layers: List[Any]
+    scale_bar: QgsLayoutItemScaleBar
+    exporter: Optional[QgsLayoutExporter] = None
+    export_settings: Any = None
+    ov_map: Optional[QgsLayoutItemMap] = None
+    ov_layers: List[Any] = field(default_factory=list)
+    ov_label_layer: Optional[QgsVectorLayer] = None
+    ctx_originals: List[Tuple[Any, str, float]] = field(default_factory=list)
+    layer_name: str = ""
+    # Per-feature transient layers, removed after each export
+    highlight_layer: Optional[QgsVectorLayer] = None
+    ov_highlight: Optional[QgsVectorLayer] = None
+
+
+@dataclass
+class _PdfBook:
+    """An open multi-page PDF receiving one page per feature."""
+
+    path: Path
+    writer: QPdfWriter
+    painter: QPainter
+    pages: int = 0
+
+
 class ReportComposer:
     """Orchestrates report generation for all territorial units."""
 
@@ -148,6 +313,14 @@ class ReportComposer:
         self._data_engine = DataEngine()
         self._map_renderer = MapRenderer(self._project)
         self._chart_engine = ChartEngine(use_plotly=False, dark_theme=False)
+        self._layout_cache: Optional[_LayoutSkeleton] = None
+        self._shard_dirs: Set[Path] = set()
+        self._pdf_book: Optional[_PdfBook] = None
+        self._transform_cache: Optional[Tuple[
+            QgsCoordinateReferenceSystem,
+            QgsCoordinateReferenceSystem,
+            QgsCoordinateTransform,
+        ]] = None
 
     def _resolve_template(self, name: str = "default") -> TemplateConfig:
         """Resolve a template configuration by name."""
@@ -164,6 +337,19 @@ class ReportComposer:
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
     ) -> List[Path]:
         """Generate reports for all (or specified) features."""
+        return list(self.generate_batch_iter(config, progress_callback))
+
+    def generate_batch_iter(
+        self,
+        config: ReportConfig,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> Iterator[Path]:
+        """Generate reports lazily, yielding each output path once exported.
+
+        Callers can pipeline downstream work (zipping, uploading, indexing)
+        without waiting for the whole batch.  The temporary base map layer
+        is removed when the iterator is exhausted or closed.
+        """
         layer = self._resolve_layer(config.layer_id)
         self._data_engine.load(
             layer, config.id_field, config.name_field, config.indicator_fields
@@ -171,51 +357,102 @@ class ReportComposer:
 
         feature_ids = config.feature_ids or self._data_engine.feature_ids
         total = len(feature_ids)
-        output_paths: List[Path] = []
 
         config.output_dir.mkdir(parents=True, exist_ok=True)
         primary_field = config.indicator_fields[0]
 
         self._apply_renderer(layer, config, primary_field)
-        stats = self._data_engine.compute_stats(primary_field)
-        ranking = self._data_engine.compute_ranking(primary_field, ascending=False)
+        stats, ranking = self._data_engine.compute_stats_and_ranking(
+            primary_field
+        )
         template = config.template or _DEFAULT_TEMPLATE
 
         # Pre-create base map layer ONCE and register in project
         base_layer = self._create_base_map_layer(config.base_map)
 
-        for i, fid in enumerate(feature_ids):
-            name = self._data_engine._names_cache.get(fid, str(fid))
-            if progress_callback:
-                progress_callback(i + 1, total, name)
-            QApplication.processEvents()
-
-            try:
-                path = self._generate_single(
-                    config, layer, template, fid, name,
-                    primary_field, stats, ranking, base_layer,
-                )
-                output_paths.append(path)
-            except Exception:
-                import traceback
-                traceback.print_exc()
-                continue
-
-            if i > 0 and i % 10 == 0:
-                gc.collect()
+        # Phase 1: snapshot every target geometry in a single layer scan.
+        # Layout building and export (phase 2) must stay on the main thread
+        # because QgsPrintLayout and QgsProject are not thread-safe.
+        geometries = self._collect_feature_geometries(
+            layer, config.id_field, feature_ids
+        )
+        if config.schedule_by_locality:
+            feature_ids = self._locality_order(feature_ids, geometries)
+
+        # Bind everything that is constant for the batch once, so the loop
+        # only passes what varies per feature.
+        render = partial(
+            self._generate_single, config, layer, template,
+            primary_field=primary_field, stats=stats, ranking=ranking,
+            base_layer=base_layer,
+        )
+        names = self._data_engine.feature_names(feature_ids)
+        get_geometry = geometries.get
 
-        # Cleanup: remove temporary base map layer from project
-        if base_layer:
-            self._project.removeMapLayer(base_layer.id())
+        multipage = config.output_format == OutputFormat.PDF_MULTIPAGE
+        book_path: Optional[Path] = None
 
-        return output_paths
+        last_yield = 0.0
+        gc_policy = GcPolicy(config.gc_every)
+        try:
+            for i, (fid, name) in enumerate(zip(feature_ids, names)):
+                if progress_callback:
+                    progress_callback(i + 1, total, name)
+
+                # Throttled yield; skip queued input so mouse moves do not
+                # trigger canvas repaints between exports.
+                now = time.monotonic()
+                if now - last_yield > _YIELD_INTERVAL_S:
+                    QApplication.processEvents(
+                        QEventLoop.ExcludeUserInputEvents
+                    )
+                    last_yield = now
+
+                try:
+                    with gc_policy.paused():
+                        path = render(fid, name, geometry=get_geometry(fid))
+                except Exception as exc:
+                    # Stack only when debugging: formatting it costs more
+                    # than the failed report on noisy data.
+                    _log.warning(
+                        "report %s failed: %s", name, exc,
+                        exc_info=_log.isEnabledFor(logging.DEBUG),
+                    )
+                    continue
+                finally:
+                    gc_policy.step(i)
+
+                if multipage:
+                    book_path = path
+                    continue
+                yield path
+
+            if book_path is not None:
+                if not self._close_pdf_book():
+                    raise RuntimeError(
+                        f"Could not finish the multi-page PDF '{book_path}'."
+                    )
+                yield book_path
+        finally:
+            # Cleanup: drop the cached layout, then the temporary base map
+            self._release_layout()
+            if base_layer:
+                self._project.removeMapLayer(base_layer.id())
 
     # ------------------------------------------------------------------
     # Preview generation
     # ------------------------------------------------------------------
 
-    def generate_preview(self, config: ReportConfig) -> Path:
-        """Generate a single preview report (first feature) as PNG."""
+    def generate_preview(self, config: ReportConfig) -> QImage:
+        """Render a single preview report (first feature) in memory.
+
+        The page is rasterized at 96 dpi straight into a QImage, so the
+        preview never round-trips through a file on disk.
+
+        Returns:
+            The rendered page.  Releases up to 1.2.0 returned the ``Path``
+            of a temporary PNG instead; there is no file to load or delete.
+        """
         layer = self._resolve_layer(config.layer_id)
         self._data_engine.load(
             layer, config.id_field, config.name_field, config.indicator_fields
@@ -223,8 +460,9 @@ class ReportComposer:
 
         primary_field = config.indicator_fields[0]
         self._apply_renderer(layer, config, primary_field)
-        stats = self._data_engine.compute_stats(primary_field)
-        ranking = self._data_engine.compute_ranking(primary_field, ascending=False)
+        stats, ranking = self._data_engine.compute_stats_and_ranking(
+            primary_field
+        )
 
         fids = self._data_engine.feature_ids
         if not fids:
@@ -233,28 +471,32 @@ class ReportComposer:
         name = self._data_engine._names_cache.get(target_fid, str(target_fid))
 
         # Use replace to carry over ALL settings (opacity, highlight, etc.)
-        preview_config = replace(
-            config,
-            output_format=OutputFormat.PNG,
-            output_dir=Path(tempfile.gettempdir()),
-            dpi=96,
-        )
+        preview_config = replace(config, dpi=96)
 
         base_layer = self._create_base_map_layer(preview_config.base_map)
         
         template = preview_config.template or _DEFAULT_TEMPLATE
 
-        result = self._generate_single(
-            preview_config, layer, template,
-            target_fid, f"preview_{name}",
-            primary_field, stats, ranking, base_layer,
-        )
-
-        # Cleanup base map from project
-        if base_layer:
-            self._project.removeMapLayer(base_layer.id())
-
-        return result
+        try:
+            skel = self._compose_feature(
+                preview_config, layer, template, target_fid, name,
+                primary_field, base_layer, None,
+            )
+            try:
+                image = skel.exporter.renderPageToImage(
+                    0, QSize(), preview_config.dpi
+                )
+            finally:
+                self._drop_feature_layers(skel)
+        finally:
+            # Cleanup cached layout and base map from project
+            self._release_layout()
+            if base_layer:
+                self._project.removeMapLayer(base_layer.id())
+
+        if image.isNull():
+            raise RuntimeError(f"Preview rendering failed for '{name}'.")
+        return image
 
     # ------------------------------------------------------------------
     # Single report (core layout engine)
@@ -271,10 +513,108 @@ class ReportComposer:
         stats: Any,
         ranking: Any,
         base_layer: Optional[QgsRasterLayer] = None,
+        geometry: Optional[QgsGeometry] = None,
     ) -> Path:
-        """Generate a single report page with premium layout."""
+        """Generate a single report page with premium layout.
+
+        The feature-independent part of the layout is built once per batch
+        (see ``_layout_skeleton``); only the title, map extents, highlight
+        overlays and scale bar are updated per feature.  ``geometry`` may be
+        prefetched by the caller (see ``_collect_feature_geometries``);
+        otherwise it is looked up by ID.  Callers must invoke
+        ``_release_layout`` when the batch ends.
+        """
+        skel = self._compose_feature(
+            config, layer, template, feature_id, name,
+            primary_field, base_layer, geometry,
+        )
+        try:
+            if config.output_format == OutputFormat.PDF_MULTIPAGE:
+                return self._append_pdf_page(skel, config)
+            return self._export(
+                skel.layout, config, self._sanitize_filename(name),
+                exporter=skel.exporter,
+                settings=skel.export_settings,
+            )
+        finally:
+            self._drop_feature_layers(skel)
 
-        safe_name = self._sanitize_filename(name)
+    def _compose_feature(
+        self,
+        config: ReportConfig,
+        layer: QgsVectorLayer,
+        template: TemplateConfig,
+        feature_id: Any,
+        name: str,
+        primary_field: str,
+        base_layer: Optional[QgsRasterLayer],
+        geometry: Optional[QgsGeometry],
+    ) -> _LayoutSkeleton:
+        """Point the cached layout at one feature, ready for rendering.
+
+        The caller must ``_drop_feature_layers`` once the page is rendered.
+        """
+        skel = self._layout_skeleton(
+            config, layer, template, primary_field, base_layer
+        )
+
+        # feature_id corresponds to the chosen ID field (attribute), not
+        # necessarily the internal QGIS Feature ID (FID).  The geometry is
+        # fetched once and shared by the extent, highlight and overview.
+        if geometry is None:
+            geometry = self._lookup_feature_geometry(
+                layer, config.id_field, feature_id
+            )
+
+        try:
+            with self._batched_updates(skel.layout):
+                self._update_layout(
+                    skel, config, layer, config.custom_title or name, geometry
+                )
+        except Exception:
+            self._drop_feature_layers(skel)
+            raise
+        return skel
+
+    # ------------------------------------------------------------------
+    # Layout skeleton (built once, reused across features)
+    # ------------------------------------------------------------------
+
+    def _layout_skeleton(
+        self,
+        config: ReportConfig,
+        layer: QgsVectorLayer,
+        template: TemplateConfig,
+        primary_field: str,
+        base_layer: Optional[QgsRasterLayer],
+    ) -> _LayoutSkeleton:
+        """Return the cached layout skeleton, rebuilding it if inputs changed."""
+        skel = self._layout_cache
+        if (
+            skel is not None
+            and skel.config is config
+            and skel.template is template
+            and skel.layer is layer
+            and skel.base_layer is base_layer
+        ):
+            return skel
+
+        self._release_layout()
+        skel = self._build_layout_skeleton(
+            config, layer, template, primary_field, base_layer
+        )
+        self._layout_cache = skel
+        return skel
+
+    def _build_layout_skeleton(
+        self,
+        config: ReportConfig,
+        layer: QgsVectorLayer,
+        template: TemplateConfig,
+        primary_field: str,
+        base_layer: Optional[QgsRasterLayer],
+    ) -> _LayoutSkeleton:
+        """Build every layout item that does not depend on the feature."""
         palette = template.color_palette or _DEFAULT_TEMPLATE.color_palette
 
         # Apply overrides if present
@@ -333,14 +673,14 @@ class ReportComposer:
         # Use full page width for title/subtitle to ensure they are centered on the PAGE,
         # regardless of logo presence (unless text is extremely long, which is edge case).
         # User requested strict centering relative to page borders.
-        title_text = config.custom_title or name
+        # The title text is set per feature in _update_layout.
         
         # Always use full width for centering
         title_x = 0.0
         title_w = pw
         
-        self._add_label(
-            layout, title_text,
+        title_item = self._add_label(
+            layout, "",
             rect_mm=(title_x, 2, title_w, 16),
             font_size=24, bold=True,
             halign=Qt.AlignCenter, valign=Qt.AlignVCenter,
@@ -387,43 +727,10 @@ class ReportComposer:
         map_item.setBackgroundColor(QColor(palette.get("map_bg", "#F1F5F9")))
         map_item.setBackgroundEnabled(True)
 
-        # ── Compute extent based on FID (not expression) ──
-        # Use setFilterFid for robustness
-        # Note: _get_feature_extent expects (layer, id_field, feature_id)
-        # But we are moving to FIDs. For now, we adapt existing method or use new one.
-        # Since _get_feature_extent uses expression, we pass FID as feature_id and updated field
-        # or we just get geometry directly here.
-        
-        # Let's get geometry directly using FID
-        # Use expression filter since feature_id corresponds to the chosen ID field (attribute),
-        # not necessarily the internal QGIS Feature ID (FID).
-        expr = self._map_renderer._build_filter_expression(feature_id, config.id_field)
-        req = QgsFeatureRequest().setFilterExpression(expr)
-        feat = next(layer.getFeatures(req), None)
-        if feat and feat.geometry():
-            extent_layer_crs = feat.geometry().boundingBox()
-        else:
-            extent_layer_crs = layer.extent()
-
-        extent = self._transform_extent(
-            extent_layer_crs, layer.crs(), self._project.crs()
-        )
-        map_item.zoomToExtent(extent)
-
         # ── Visual Enhancements ──
 
-        # 1. Apply Style (Refactored Phase 16)
-        self._map_renderer.apply_style(
-            layer,
-            config.map_style,
-            primary_field,
-            color_ramp=config.color_ramp_name,
-            graduated_mode=config.graduated_mode,
-            classes=config.graduated_classes,
-            single_color=config.single_color,
-            category_field=config.category_field,
-            opacity=config.map_opacity
-        )
+        # 1. Style: applied once by the batch / preview entry point
+        #    (_apply_renderer) before any layout is built.
 
         # 2. Labels
         if config.label_field:
@@ -431,24 +738,8 @@ class ReportComposer:
         else:
             layer.setLabelsEnabled(False)
 
-        # 3. Highlight Overlay (Analyzed Feature)
-        highlight_layer = None
-        if config.highlight_analyzed:
-             # Get feature geometry
-             # Re-fetch feature to ensure valid context
-             iterator = layer.getFeatures(QgsFeatureRequest().setFilterExpression(
-                 self._map_renderer._build_filter_expression(feature_id, config.id_field)
-             ))
-             for feat in iterator:
-                 if feat.geometry():
-                     highlight_layer = self._map_renderer.create_highlight_overlay(
-                         feat.geometry(), layer.crs(), color="#FF00FF", width=0.8
-                     )
-                     if highlight_layer:
-                        self._project.addMapLayer(highlight_layer, False)
-                     break
-
         # 3. Context Layers (with per-layer opacity and legend alias)
+        # Originals are restored in _release_layout.
         context_layers = []
         _ctx_originals: list = []  # (layer, original_name, original_opacity)
         for ctx_cfg in config.context_layers_config:
@@ -460,12 +751,10 @@ class ReportComposer:
                     lyr.setName(ctx_cfg.legend_alias)
                 context_layers.append(lyr)
 
-        # ── Set Layers: Order matters (First = Top) ──
-        # [Highlight, Contexts..., MainLayer, BaseMap]
+        # ── Static layer stack (First = Top) ──
+        # [Contexts..., MainLayer, BaseMap]; the per-feature highlight
+        # overlay is prepended in _update_layout.
         layers_for_map = []
-        if highlight_layer:
-            layers_for_map.append(highlight_layer)
-
         layers_for_map.extend(context_layers)
         layers_for_map.append(layer)
 
@@ -475,7 +764,6 @@ class ReportComposer:
         map_item.setLayers(layers_for_map)
         map_item.setKeepLayerSet(True)
         map_item.setKeepLayerStyles(True)
-        map_item.refresh()
 
         # Map border
         map_item.setFrameEnabled(True)
@@ -513,7 +801,7 @@ class ReportComposer:
         legend_layers = [layer] + context_layers
 
         # Temporarily rename analysis layer for the legend
-        # (restored AFTER export so the rendered legend shows the alias)
+        # (restored in _release_layout so the rendered legend shows the alias)
         _orig_layer_name = layer.name()
         if config.layer_legend_alias:
             layer.setName(config.layer_legend_alias)
@@ -549,9 +837,9 @@ class ReportComposer:
         )
 
         # ══════════════════════════════════════════════════════════════
-        # 5. SCALE BAR
+        # 5. SCALE BAR (segments re-fitted per feature)
         # ══════════════════════════════════════════════════════════════
-        self._map_renderer.add_scale_bar(
+        scale_bar = self._map_renderer.add_scale_bar(
             layout, map_item,
             (map_x + 5, map_y + map_h - 12),
         )
@@ -559,8 +847,9 @@ class ReportComposer:
         # ══════════════════════════════════════════════════════════════
         # 5b. OVERVIEW MAP (Inset)
         # ══════════════════════════════════════════════════════════════
-        ov_highlight = None  # track for cleanup
-        _ov_label_layer = None  # track cloned label-toggled layer
+        ov_map = None
+        ov_layers: list = []
+        _ov_label_layer = None  # cloned label-toggled layer
         if config.show_overview_map:
             ov_size = 45.0
             ov_margin = 3.0
@@ -579,95 +868,7 @@ class ReportComposer:
                 layout, (ov_x, ov_y, ov_size, ov_size)
             )
 
-            # ── Compute regional extent (feature + 50% buffer) ──
-            feat_geom = None
-            iterator = layer.getFeatures(QgsFeatureRequest().setFilterExpression(
-                self._map_renderer._build_filter_expression(feature_id, config.id_field)
-            ))
-            for feat in iterator:
-                if feat.geometry() and not feat.geometry().isEmpty():
-                    feat_geom = feat.geometry()
-                    break
-
-            if feat_geom:
-                bbox = feat_geom.boundingBox()
-                buf_w = bbox.width() * 1.0
-                buf_h = bbox.height() * 1.0
-                # Ensure minimum buffer so tiny features still have context
-                min_buf = max(bbox.width(), bbox.height(), 0.01) * 0.3
-                buf_w = max(buf_w, min_buf)
-                buf_h = max(buf_h, min_buf)
-                regional = QgsRectangle(
-                    bbox.xMinimum() - buf_w,
-                    bbox.yMinimum() - buf_h,
-                    bbox.xMaximum() + buf_w,
-                    bbox.yMaximum() + buf_h,
-                )
-                ov_extent = self._transform_extent(
-                    regional, layer.crs(), self._project.crs()
-                )
-            else:
-                ov_extent = self._transform_extent(
-                    layer.extent(), layer.crs(), self._project.crs()
-                )
-
-            ov_map.zoomToExtent(ov_extent)
-
-            # ── Highlight: polygon fill vs bbox for lines/points ──
-            from qgis.core import (
-                QgsFeature, QgsFillSymbol, QgsVectorLayer as QgsVL, QgsWkbTypes,
-            )
-
-            if feat_geom:
-                geom_type = QgsWkbTypes.geometryType(feat_geom.wkbType())
-
-                if geom_type == QgsWkbTypes.PolygonGeometry:
-                    # Red fill with 40% opacity for polygons
-                    is_multi = QgsWkbTypes.isMultiType(feat_geom.wkbType())
-                    uri_type = "MultiPolygon" if is_multi else "Polygon"
-                    uri = f"{uri_type}?crs={layer.crs().authid()}"
-                    ov_highlight = QgsVL(uri, "OverviewHighlight", "memory")
-                    if ov_highlight.isValid():
-                        prov = ov_highlight.dataProvider()
-                        f = QgsFeature()
-                        f.setGeometry(feat_geom)
-                        prov.addFeatures([f])
-                        ov_highlight.updateExtents()
-                        sym = QgsFillSymbol.createSimple({
-                            "color": "255,0,0,100",  # red with ~40% opacity
-                            "outline_color": "#FF0000",
-                            "outline_style": "solid",
-                            "outline_width": "0.8",
-                        })
-                        ov_highlight.renderer().setSymbol(sym)
-                        self._project.addMapLayer(ov_highlight, False)
-                else:
-                    # For lines/points: red translucent bounding box
-                    bbox_geom = feat_geom.boundingBox()
-                    from qgis.core import QgsGeometry
-                    rect_geom = QgsGeometry.fromRect(bbox_geom)
-                    uri = f"Polygon?crs={layer.crs().authid()}"
-                    ov_highlight = QgsVL(uri, "OverviewHighlight", "memory")
-                    if ov_highlight.isValid():
-                        prov = ov_highlight.dataProvider()
-                        f = QgsFeature()
-                        f.setGeometry(rect_geom)
-                        prov.addFeatures([f])
-                        ov_highlight.updateExtents()
-                        sym = QgsFillSymbol.createSimple({
-                            "color": "255,0,0,60",  # red with ~25% opacity
-                            "outline_color": "#FF0000",
-                            "outline_style": "dash",
-                            "outline_width": "0.6",
-                        })
-                        ov_highlight.renderer().setSymbol(sym)
-                        self._project.addMapLayer(ov_highlight, False)
-
-            # ── Build layer stack for overview ──
-            ov_layers = []
-            if ov_highlight and ov_highlight.isValid():
-                ov_layers.append(ov_highlight)
-
+            # ── Static overview stack; the highlight is prepended per feature ──
             # Clone main layer to toggle labels independently
             _ov_label_layer = layer.clone()
             _ov_label_layer.setLabelsEnabled(config.show_overview_labels)
@@ -685,7 +886,6 @@ class ReportComposer:
             ov_map.setFrameStrokeWidth(
                 QgsLayoutMeasurement(0.3, Qgis.LayoutUnit.Millimeters)
             )
-            ov_map.refresh()
 
         # ══════════════════════════════════════════════════════════════
         # 6. FOOTER BAND
@@ -706,21 +906,199 @@ class ReportComposer:
             font_family=template.font_family
         )
 
-        # ══════════════════════════════════════════════════════════════
-        # 7. EXPORT
-        # ══════════════════════════════════════════════════════════════
-        output_path = self._export(layout, config, safe_name)
-        
-        # Cleanup temporary layers
-        if highlight_layer:
-            self._project.removeMapLayer(highlight_layer.id())
-        if ov_highlight:
-            self._project.removeMapLayer(ov_highlight.id())
-        if _ov_label_layer:
-            self._project.removeMapLayer(_ov_label_layer.id())
+        return _LayoutSkeleton(
+            config=config,
+            template=template,
+            layer=layer,
+            base_layer=base_layer,
+            layout=layout,
+            title_item=title_item,
+            map_item=map_item,
+            map_layers=layers_for_map,
+            scale_bar=scale_bar,
+            exporter=QgsLayoutExporter(layout),
+            export_settings=self._export_settings(config),
+            ov_map=ov_map,
+            ov_layers=ov_layers,
+            ov_label_layer=_ov_label_layer,
+            ctx_originals=_ctx_originals,
+            layer_name=_orig_layer_name,
+        )
+
+    @staticmethod
+    @contextmanager
+    def _batched_updates(layout: QgsPrintLayout) -> Iterator[None]:
+        """Block layout signals while items are mutated, then refresh once."""
+        was_blocked = layout.blockSignals(True)
+        try:
+            yield
+        finally:
+            layout.blockSignals(was_blocked)
+            layout.refresh()
+
+    def _update_layout(
+        self,
+        skel: _LayoutSkeleton,
+        config: ReportConfig,
+        layer: QgsVectorLayer,
+        title_text: str,
+        geometry: Optional[QgsGeometry],
+    ) -> None:
+        """Point the cached layout at a new feature.
+
+        Run inside ``_batched_updates``: items are not refreshed here.
+        """
+        skel.title_item.setText(title_text)
+
+        # ── Compute extent from the feature geometry ──
+        if geometry:
+            extent_layer_crs = geometry.boundingBox()
+        else:
+            extent_layer_crs = layer.extent()
+
+        extent = self._transform_extent(
+            extent_layer_crs, layer.crs(), self._project.crs()
+        )
+        skel.map_item.zoomToExtent(extent)
+
+        # ── Highlight Overlay (Analyzed Feature) ──
+        # Set Layers: Order matters (First = Top) -> [Highlight, static stack]
+        layers_for_map = list(skel.map_layers)
+        if config.highlight_analyzed and geometry:
+            skel.highlight_layer = self._map_renderer.create_highlight_overlay(
+                geometry, layer.crs(), color="#FF00FF", width=0.8
+            )
+            if skel.highlight_layer:
+                self._project.addMapLayer(skel.highlight_layer, False)
+                layers_for_map.insert(0, skel.highlight_layer)
+
+        skel.map_item.setLayers(layers_for_map)
+
+        self._map_renderer.fit_scale_bar(skel.scale_bar, skel.map_item)
+        skel.scale_bar.update()
+
+        if skel.ov_map is None:
+            return
+
+        # ── Compute regional extent (feature + 50% buffer) ──
+        feat_geom = None
+        if geometry and not geometry.isEmpty():
+            feat_geom = geometry
+
+        if feat_geom:
+            bbox = feat_geom.boundingBox()
+            buf_w = bbox.width() * 1.0
+            buf_h = bbox.height() * 1.0
+            # Ensure minimum buffer so tiny features still have context
+            min_buf = max(bbox.width(), bbox.height(), 0.01) * 0.3
+            buf_w = max(buf_w, min_buf)
+            buf_h = max(buf_h, min_buf)
+            regional = QgsRectangle(
+                bbox.xMinimum() - buf_w,
+                bbox.yMinimum() - buf_h,
+                bbox.xMaximum() + buf_w,
+                bbox.yMaximum() + buf_h,
+            )
+            ov_extent = self._transform_extent(
+                regional, layer.crs(), self._project.crs()
+            )
+        else:
+            ov_extent = self._transform_extent(
+                layer.extent(), layer.crs(), self._project.crs()
+            )
+
+        skel.ov_map.zoomToExtent(ov_extent)
+
+        ov_layers = list(skel.ov_layers)
+        if feat_geom:
+            skel.ov_highlight = self._create_overview_highlight(
+                feat_geom, layer.crs()
+            )
+            if skel.ov_highlight:
+                self._project.addMapLayer(skel.ov_highlight, False)
+                ov_layers.insert(0, skel.ov_highlight)
+
+        skel.ov_map.setLayers(ov_layers)
+
+    @staticmethod
+    def _create_overview_highlight(
+        feat_geom: QgsGeometry,
+        crs: QgsCoordinateReferenceSystem,
+    ) -> Optional[QgsVectorLayer]:
+        """Build the overview highlight: polygon fill vs bbox for lines/points."""
+        from qgis.core import QgsFeature, QgsFillSymbol, QgsWkbTypes
+
+        geom_type = QgsWkbTypes.geometryType(feat_geom.wkbType())
+
+        if geom_type == QgsWkbTypes.PolygonGeometry:
+            # Red fill with 40% opacity for polygons
+            is_multi = QgsWkbTypes.isMultiType(feat_geom.wkbType())
+            uri_type = "MultiPolygon" if is_multi else "Polygon"
+            geom = feat_geom
+            sym_props = {
+                "color": "255,0,0,100",  # red with ~40% opacity
+                "outline_color": "#FF0000",
+                "outline_style": "solid",
+                "outline_width": "0.8",
+            }
+        else:
+            # For lines/points: red translucent bounding box
+            uri_type = "Polygon"
+            geom = QgsGeometry.fromRect(feat_geom.boundingBox())
+            sym_props = {
+                "color": "255,0,0,60",  # red with ~25% opacity
+                "outline_color": "#FF0000",
+                "outline_style": "dash",
+                "outline_width": "0.6",
+            }
+
+        uri = f"{uri_type}?crs={crs.authid()}"
+        ov_highlight = QgsVectorLayer(uri, "OverviewHighlight", "memory")
+        if not ov_highlight.isValid():
+            return None
+
+        prov = ov_highlight.dataProvider()
+        f = QgsFeature()
+        f.setGeometry(geom)
+        prov.addFeatures([f])
+        ov_highlight.updateExtents()
+        ov_highlight.renderer().setSymbol(QgsFillSymbol.createSimple(sym_props))
+        return ov_highlight
+
+    def _drop_feature_layers(self, skel: _LayoutSkeleton) -> None:
+        """Remove the per-feature highlight layers from the project."""
+        for lyr in (skel.highlight_layer, skel.ov_highlight):
+            if lyr is not None:
+                try:
+                    self._project.removeMapLayer(lyr.id())
+                except Exception:
+                    pass
+        skel.highlight_layer = None
+        skel.ov_highlight = None
+
+    def _release_layout(self) -> None:
+        """Tear down the cached layout and restore modified project layers.
+
+        Any open multi-page PDF is finished first, and the shard
+        directories created are forgotten so the next batch re-creates them
+        if they were removed in between.
+        """
+        self._close_pdf_book()
+        self._shard_dirs.clear()
+        skel = self._layout_cache
+        if skel is None:
+            return
+        self._layout_cache = None
+
+        self._drop_feature_layers(skel)
+        if skel.ov_label_layer:
+            try:
+                self._project.removeMapLayer(skel.ov_label_layer.id())
+            except Exception:
+                pass
 
         # Restore original names and opacity for context layers
-        for lyr, orig_name, orig_opacity in _ctx_originals:
+        for lyr, orig_name, orig_opacity in skel.ctx_originals:
             try:
                 lyr.setName(orig_name)
                 lyr.setOpacity(orig_opacity)
@@ -728,11 +1106,12 @@ class ReportComposer:
                 pass
 
         # Restore analysis layer name
-        layer.setName(_orig_layer_name)
+        try:
+            skel.layer.setName(skel.layer_name)
+        except Exception:
+            pass
 
-        layout.clear()
-        del layout
-        return output_path
+        skel.layout.clear()
 
     # ------------------------------------------------------------------
     # Renderer helper
@@ -744,7 +1123,19 @@ class ReportComposer:
         config: ReportConfig,
         primary_field: str,
     ) -> None:
-        """Apply the correct renderer to the layer (helper for external use)."""
+        """Apply the correct renderer to the layer (helper for external use).
+
+        Call once per batch or preview, before the layout skeleton is
+        built; the skeleton itself does not restyle the layer.
+
+        Graduated breaks come from the already-loaded DataEngine values
+        when the mode allows it, sparing QGIS a full attribute scan.
+        """
+        breaks = None
+        if config.map_style == MapStyle.GRADUATED:
+            breaks = self._data_engine.compute_class_breaks(
+                primary_field, config.graduated_mode, config.graduated_classes
+            )
         self._map_renderer.apply_style(
             layer,
             config.map_style,
@@ -754,7 +1145,8 @@ class ReportComposer:
             classes=config.graduated_classes,
             single_color=config.single_color,
             category_field=config.category_field,
-            opacity=config.map_opacity
+            opacity=config.map_opacity,
+            breaks=breaks,
         )
 
     # ------------------------------------------------------------------
@@ -767,12 +1159,21 @@ class ReportComposer:
         source_crs: QgsCoordinateReferenceSystem,
         dest_crs: QgsCoordinateReferenceSystem,
     ) -> QgsRectangle:
-        """Transform an extent between coordinate reference systems."""
+        """Transform an extent between coordinate reference systems.
+
+        The last transform is cached: a batch reprojects every extent
+        between the same pair of CRSs.
+        """
         if source_crs == dest_crs:
             return extent
-        transform = QgsCoordinateTransform(
-            source_crs, dest_crs, self._project
-        )
+        cached = self._transform_cache
+        if cached and cached[0] == source_crs and cached[1] == dest_crs:
+            transform = cached[2]
+        else:
+            transform = QgsCoordinateTransform(
+                source_crs, dest_crs, self._project
+            )
+            self._transform_cache = (source_crs, dest_crs, transform)
         return transform.transformBoundingBox(extent)
 
     # ------------------------------------------------------------------
@@ -791,31 +1192,24 @@ class ReportComposer:
         if bm_type is None or bm_type == BaseMapType.NONE:
             return None
 
-        entry = _BASE_MAP_URLS.get(bm_type)
-        if not entry:
+        uri = _BASE_MAP_URIS.get(bm_type)
+        if not uri:
             return None
 
-        raw_url, zmax, zmin = entry
-
-        # Encode critical characters that conflict with QGIS key=value parsing.
-        # We preserve protocol chars (/:?=) but MUST encode '&' to '%26'.
-        encoded_url = quote(raw_url, safe="/:?=")
-        
         # Graceful Degradation: Fast network ping (Circuit Breaker for Basemaps)
-        import urllib.request
-        from urllib.error import URLError
-        import socket
-        
-        test_url = raw_url.format(z='0', x='0', y='0', q='0')
-        try:
-            req = urllib.request.Request(test_url, headers={'User-Agent': 'QGIS/AutoAtlasPro'})
-            urllib.request.urlopen(req, timeout=1.5)
-        except (URLError, socket.timeout):
-            # Cannot reach tile server, fallback immediately to map_bg 
-            # to preserve workflow stability.
-            return None
-
-        uri = f"type=xyz&url={encoded_url}&zmax={zmax}&zmin={zmin}"
+        now = time.monotonic()
+        last_ok = _BASE_MAP_REACHABLE.get(bm_type)
+        if last_ok is None or now - last_ok > _BASE_MAP_PROBE_TTL_S:
+            test_url = _BASE_MAP_PROBES[bm_type]
+            try:
+                req = urllib.request.Request(test_url, headers={'User-Agent': 'QGIS/AutoAtlasPro'})
+                urllib.request.urlopen(req, timeout=1.5)
+            except (URLError, socket.timeout):
+                # Cannot reach tile server, fallback immediately to map_bg
+                # to preserve workflow stability.
+                _BASE_MAP_REACHABLE.pop(bm_type, None)
+                return None
+            _BASE_MAP_REACHABLE[bm_type] = now
 
         layer = QgsRasterLayer(uri, f"_basemap_{bm_type.name}", "wms")
         if not layer.isValid():
@@ -891,25 +1285,64 @@ class ReportComposer:
     # Export
     # ------------------------------------------------------------------
 
+    def _output_dir_for(self, config: ReportConfig, filename: str) -> Path:
+        """Directory for one report, honouring ``config.shard_output``."""
+        if not config.shard_output:
+            return config.output_dir
+        shard = filename[:2].lower().strip(" .") or "_"
+        out_dir = config.output_dir / shard
+        if out_dir not in self._shard_dirs:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            self._shard_dirs.add(out_dir)
+        return out_dir
+
+    @staticmethod
+    def _export_settings(config: ReportConfig) -> Any:
+        """Build the PDF export settings for ``config``.
+
+        Multi-page books share them through ``_apply_pdf_render_context``.
+        Image output renders the page directly and needs none (None).
+        """
+        if config.output_format not in (
+            OutputFormat.PDF, OutputFormat.PDF_MULTIPAGE
+        ):
+            return None
+        settings = QgsLayoutExporter.PdfExportSettings()
+        settings.dpi = config.dpi
+        return settings
+
     def _export(
         self,
         layout: QgsPrintLayout,
         config: ReportConfig,
         filename: str,
+        exporter: Optional[QgsLayoutExporter] = None,
+        settings: Any = None,
     ) -> Path:
-        """Export the layout to PDF or PNG."""
-        exporter = QgsLayoutExporter(layout)
+        """Export the layout to PDF or PNG.
 
+        Pass the ``exporter`` bound to a reused layout and ``settings`` from
+        ``_export_settings`` to avoid recreating them for every page.  PNGs
+        are rendered straight to a QImage and saved, skipping the
+        ``exportToImage`` pipeline (world files, cropping, multi-page
+        naming) that single-page reports never use.
+        """
+        if exporter is None:
+            exporter = QgsLayoutExporter(layout)
+        if settings is None:
+            settings = self._export_settings(config)
+
+        out_dir = self._output_dir_for(config, filename)
         if config.output_format == OutputFormat.PDF:
-            out_path = config.output_dir / f"{filename}.pdf"
-            settings = QgsLayoutExporter.PdfExportSettings()
-            settings.dpi = config.dpi
+            out_path = out_dir / f"{filename}.pdf"
             result = exporter.exportToPdf(str(out_path), settings)
         else:
-            out_path = config.output_dir / f"{filename}.png"
-            settings = QgsLayoutExporter.ImageExportSettings()
-            settings.dpi = config.dpi
-            result = exporter.exportToImage(str(out_path), settings)
+            out_path = out_dir / f"{filename}.png"
+            image = exporter.renderPageToImage(0, QSize(), config.dpi)
+            if image.isNull() or not image.save(str(out_path), "PNG"):
+                result = QgsLayoutExporter.FileError
+            else:
+                result = QgsLayoutExporter.Success
 
         if result != QgsLayoutExporter.Success:
             raise RuntimeError(
@@ -917,10 +1350,190 @@ class ReportComposer:
             )
         return out_path
 
+    def _append_pdf_page(
+        self, skel: _LayoutSkeleton, config: ReportConfig
+    ) -> Path:
+        """Render the composed page as the next page of the batch PDF.
+
+        The document is opened on the first page and finished by
+        ``_close_pdf_book``; all pages share one writer and font set.
+        """
+        book = self._pdf_book
+        if book is None:
+            path = config.output_dir / self._pdf_book_name(
+                config, skel.layer_name
+            )
+            size = skel.layout.pageCollection().page(0).pageSize()
+
+            writer = QPdfWriter(str(path))
+            writer.setResolution(config.dpi)
+            writer.setPageSize(
+                QPageSize(
+                    QSizeF(size.width(), size.height()), QPageSize.Millimeter
+                )
+            )
+            writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+            writer.setCreator("AutoAtlas Pro")
+
+            # QPainter fails silently when the file cannot be opened
+            # (read-only directory, PDF held open by a viewer)
+            painter = QPainter(writer)
+            if not painter.isActive():
+                raise RuntimeError(f"Cannot open '{path}' for writing.")
+
+            self._apply_pdf_render_context(
+                skel.layout,
+                skel.export_settings or self._export_settings(config),
+            )
+            book = _PdfBook(path, writer, painter)
+            self._pdf_book = book
+        elif book.pages:
+            book.writer.newPage()
+
+        skel.exporter.renderPage(book.painter, 0)
+        book.pages += 1
+        return book.path
+
+    @classmethod
+    def _pdf_book_name(cls, config: ReportConfig, layer_name: str) -> str:
+        """Filename of the multi-page PDF for one batch run.
+
+        Built from the legend alias (or layer name) and primary indicator,
+        stamped with the start time so repeated runs do not overwrite.
+        """
+        stem = cls._sanitize_filename(
+            f"{config.layer_legend_alias or layer_name}"
+            f"_{config.indicator_fields[0]}"
+        ).strip("_ ") or "atlas"
+        return f"{stem}_{datetime.now():%Y%m%d_%H%M%S}.pdf"
+
+    @staticmethod
+    def _apply_pdf_render_context(
+        layout: QgsPrintLayout, settings: Any
+    ) -> None:
+        """Set up ``layout`` for painting onto a PDF as ``exportToPdf`` does.
+
+        Mirrors the render context the exporter applies from ``settings``:
+        dpi, flags, vector output, text rendering and geometry
+        simplification.  What ``exportToPdf`` writes after rendering
+        (georeferencing, document metadata) has no equivalent here.
+        """
+        context = layout.renderContext()
+        context.setDpi(settings.dpi)
+        context.setFlags(settings.flags)
+        # QPdfWriter, like QPrinter, lacks composition modes
+        context.setFlag(
+            QgsLayoutRenderContext.FlagUseAdvancedEffects,
+            not settings.forceVectorOutput,
+        )
+        context.setFlag(
+            QgsLayoutRenderContext.FlagForceVectorOutput,
+            settings.forceVectorOutput,
+        )
+        context.setTextRenderFormat(settings.textRenderFormat)
+        if settings.simplifyGeometries:
+            # Same conservative 0.1 px grid snapping the exporter uses
+            method = QgsVectorSimplifyMethod()
+            method.setSimplifyHints(
+                QgsVectorSimplifyMethod.GeometrySimplification
+            )
+            method.setForceLocalOptimization(True)
+            method.setSimplifyAlgorithm(
+                QgsVectorSimplifyMethod.SnappedToGridGlobal
+            )
+            method.setThreshold(0.1)
+            context.setSimplifyMethod(method)
+
+    def _close_pdf_book(self) -> bool:
+        """Finish the open multi-page PDF, if any.
+
+        Returns:
+            False if the document could not be finished (the file is
+            incomplete), True otherwise.
+        """
+        book = self._pdf_book
+        if book is None:
+            return True
+        self._pdf_book = None
+        if book.painter.end():
+            return True
+        _log.error("could not finish multi-page PDF %s", book.path)
+        return False
+
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
 
+    def _lookup_feature_geometry(
+        self,
+        layer: QgsVectorLayer,
+        id_field: str,
+        feature_id: Any,
+    ) -> Optional[QgsGeometry]:
+        """Fetch the geometry of a single feature by its ID attribute."""
+        expr = self._map_renderer._build_filter_expression(feature_id, id_field)
+        request = QgsFeatureRequest().setFilterExpression(expr)
+        for feat in layer.getFeatures(request):
+            if feat.geometry():
+                return QgsGeometry(feat.geometry())
+        return None
+
+    @staticmethod
+    def _collect_feature_geometries(
+        layer: QgsVectorLayer,
+        id_field: str,
+        feature_ids: List[Any],
+    ) -> Dict[Any, QgsGeometry]:
+        """Snapshot the geometries of all target features in a single scan.
+
+        Replaces one expression-filtered query per feature with one
+        sequential pass over the layer, fetching only the ID attribute.
+        """
+        wanted = set(feature_ids)
+        request = QgsFeatureRequest().setSubsetOfAttributes(
+            [id_field], layer.fields()
+        )
+        geometries: Dict[Any, QgsGeometry] = {}
+        for feat in layer.getFeatures(request):
+            fid = feat[id_field]
+            if fid in wanted and fid not in geometries and feat.geometry():
+                geometries[fid] = QgsGeometry(feat.geometry())
+        return geometries
+
+    @staticmethod
+    def _locality_order(
+        feature_ids: List[Any],
+        geometries: Dict[Any, QgsGeometry],
+    ) -> List[Any]:
+        """Sort feature IDs by the Morton code of their bounding-box centre.
+
+        Features without geometry keep their relative order at the end.
+        """
+        centres: Dict[Any, Tuple[float, float]] = {}
+        for fid in feature_ids:
+            geom = geometries.get(fid)
+            if geom and not geom.isEmpty():
+                c = geom.boundingBox().center()
+                centres[fid] = (c.x(), c.y())
+        if not centres:
+            return list(feature_ids)
+
+        xs = [c[0] for c in centres.values()]
+        ys = [c[1] for c in centres.values()]
+        min_x, min_y = min(xs), min(ys)
+        span_x = (max(xs) - min_x) or 1.0
+        span_y = (max(ys) - min_y) or 1.0
+
+        codes = {
+            fid: _morton_code(
+                int((x - min_x) / span_x * 0xFFFF),
+                int((y - min_y) / span_y * 0xFFFF),
+            )
+            for fid, (x, y) in centres.items()
+        }
+        placed = sorted(centres, key=codes.__getitem__)
+        return placed + [fid for fid in feature_ids if fid not in codes]
+
     def _resolve_layer(self, layer_id: str) -> QgsVectorLayer:
         """Resolve a QGIS layer by its ID."""
         layer = self._project.mapLayer(layer_id)
@@ -933,7 +1546,4 @@ class ReportComposer:
     @staticmethod
     def _sanitize_filename(name: str) -> str:
         """Make a string safe for use as a filename."""
-        keep = set(" ._-")
-        return "".join(
-            c if c.isalnum() or c in keep else "_" for c in name
-        ).strip()
+        return _UNSAFE_FILENAME_RE.sub("_", name).strip()
@@ -6,6 +6,11 @@ These tests validate the critical rendering pipeline:
 - Feature extent calculation (numeric and string IDs)
 - Layout item creation
 - Sanitize filename
+- Batch garbage-collection policy
+- Multi-page PDF naming
+- Morton (locality) scheduling
+- DataEngine caches and class breaks
+- ReportConfig validation
 
 NOTE: Tests that require a running QGIS instance (e.g., QgsLayoutItemMap
 rendering, QgsRasterLayer validation) are marked with the ``qgis``
@@ -15,22 +20,23 @@ pytest-qgis.  Tests that are pure Python logic run anywhere.
 
 from __future__ import annotations
 
+import re
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import List, Optional
+from unittest.mock import MagicMock, call, patch
 from urllib.parse import quote, unquote
 
 
 class TestSanitizeFilename(unittest.TestCase):
     """report_composer._sanitize_filename is a static method."""
 
-    @staticmethod
-    def _sanitize(name: str) -> str:
+    _UNSAFE = re.compile(r"[^\w .\-]")
+
+    @classmethod
+    def _sanitize(cls, name: str) -> str:
         """Mirror of ReportComposer._sanitize_filename."""
-        keep = set(" ._-")
-        return "".join(
-            c if c.isalnum() or c in keep else "_" for c in name
-        ).strip()
+        return cls._UNSAFE.sub("_", name).strip()
 
     def test_normal_name(self) -> None:
         assert self._sanitize("Santiago Centro") == "Santiago Centro"
@@ -48,6 +54,15 @@ class TestSanitizeFilename(unittest.TestCase):
         result = self._sanitize("***")
         assert result == "___"
 
+    def test_matches_isalnum_scan(self) -> None:
+        """Regex must agree with the previous per-character isalnum() scan."""
+        keep = set(" ._-")
+        for name in ("Ñuble", "Región 5ª", "a/b\\c:d", " x_y-z. ", "日本 ①"):
+            expected = "".join(
+                c if c.isalnum() or c in keep else "_" for c in name
+            ).strip()
+            assert self._sanitize(name) == expected, name
+
 
 class TestXYZUrlEncoding(unittest.TestCase):
     """Validate that XYZ tile URLs are correctly percent-encoded."""
@@ -105,6 +120,20 @@ class TestXYZUrlEncoding(unittest.TestCase):
                 f"Failed for {bm_type.name}: keys={keys}"
             )
 
+    def test_precomputed_uris_are_well_formed(self) -> None:
+        """The import-time URI table must cover the registry and split cleanly."""
+        from autoatlas_pro.core.report_composer import (
+            _BASE_MAP_URIS,
+            _BASE_MAP_URLS,
+        )
+
+        assert set(_BASE_MAP_URIS) == set(_BASE_MAP_URLS)
+        for bm_type, uri in _BASE_MAP_URIS.items():
+            keys = [p.split("=", 1)[0] for p in uri.split("&")]
+            assert keys == ["type", "url", "zmax", "zmin"], (
+                f"Failed for {bm_type.name}: keys={keys}"
+            )
+
 
 class TestCRSTransform(unittest.TestCase):
     """Test extent CRS transformation logic."""
@@ -182,5 +211,324 @@ class TestBaseMapType(unittest.TestCase):
                 assert bm.value != bm.name
 
 
+class TestGcPolicy(unittest.TestCase):
+    """GcPolicy decides when a long batch runs a full collection."""
+
+    _COLLECT = "autoatlas_pro.core.report_composer.gc.collect"
+
+    @staticmethod
+    def _policy(every: int, rss: Optional[List[int]] = None):
+        """GcPolicy reading ``rss`` in order, or without psutil if None."""
+        from autoatlas_pro.core.report_composer import GcPolicy
+
+        policy = GcPolicy(every)
+        if rss is None:
+            policy._process = None
+        else:
+            policy._process = MagicMock()
+            policy._process.memory_info.side_effect = [
+                MagicMock(rss=value) for value in rss
+            ]
+        return policy
+
+    def test_without_psutil_collects_every_n(self) -> None:
+        policy = self._policy(3)
+        with patch(self._COLLECT) as collect:
+            ran = [policy.step(i) for i in range(7)]
+        assert ran == [False, False, False, True, False, False, True]
+        assert collect.call_args_list == [call(), call()]
+
+    def test_with_psutil_collects_on_growth(self) -> None:
+        # Baseline, small growth, 1.5x growth, then the post-collect reading
+        policy = self._policy(100, rss=[100, 120, 200, 110])
+        with patch(self._COLLECT) as collect:
+            ran = [policy.step(i) for i in range(3)]
+        assert ran == [False, False, True]
+        # Young generations only
+        collect.assert_called_once_with(1)
+        assert policy._baseline == 110
+
+    def test_with_psutil_ignores_every(self) -> None:
+        policy = self._policy(2, rss=[100, 100, 100, 100, 100])
+        with patch(self._COLLECT) as collect:
+            ran = [policy.step(i) for i in range(5)]
+        assert ran == [False] * 5
+        collect.assert_not_called()
+
+    def test_every_is_clamped(self) -> None:
+        assert self._policy(0).every == 1
+
+
+class TestPdfBookName(unittest.TestCase):
+    """Multi-page PDFs are named from the batch config, per run."""
+
+    @staticmethod
+    def _config(**kwargs):
+        from autoatlas_pro.core.models import OutputFormat, ReportConfig
+
+        return ReportConfig(
+            layer_id="comunas",
+            id_field="CUT_COM",
+            name_field="NOM_COM",
+            indicator_fields=["POB_TOTAL"],
+            output_format=OutputFormat.PDF_MULTIPAGE,
+            **kwargs,
+        )
+
+    def test_named_from_layer_and_indicator(self) -> None:
+        from autoatlas_pro.core.report_composer import ReportComposer
+
+        name = ReportComposer._pdf_book_name(self._config(), "Comunas RM")
+        assert re.fullmatch(r"Comunas RM_POB_TOTAL_\d{8}_\d{6}\.pdf", name)
+
+    def test_legend_alias_wins_and_is_sanitized(self) -> None:
+        from autoatlas_pro.core.report_composer import ReportComposer
+
+        config = self._config(layer_legend_alias="Región / Ñuble")
+        name = ReportComposer._pdf_book_name(config, "comunas")
+        assert name.startswith("Región _ Ñuble_POB_TOTAL_")
+        assert "/" not in name
+
+
+class TestPdfBookWriting(unittest.TestCase):
+    """A multi-page PDF that cannot be written must not pass as exported."""
+
+    _MODULE = "autoatlas_pro.core.report_composer"
+
+    @staticmethod
+    def _composer():
+        from autoatlas_pro.core.report_composer import ReportComposer
+
+        # The book helpers touch no project state
+        composer = ReportComposer.__new__(ReportComposer)
+        composer._pdf_book = None
+        return composer
+
+    def test_unwritable_book_raises(self) -> None:
+        composer = self._composer()
+        config = TestPdfBookName._config(output_dir=Path("/read-only"))
+        skel = MagicMock(layer_name="comunas")
+        with patch(f"{self._MODULE}.QPdfWriter"), \
+                patch(f"{self._MODULE}.QPainter") as painter:
+            painter.return_value.isActive.return_value = False
+            with self.assertRaisesRegex(RuntimeError, "/read-only/comunas"):
+                composer._append_pdf_page(skel, config)
+
+        skel.exporter.renderPage.assert_not_called()
+        assert composer._pdf_book is None
+
+    def test_book_pages_use_pdf_export_settings(self) -> None:
+        from autoatlas_pro.core.report_composer import ReportComposer
+
+        composer = self._composer()
+        config = TestPdfBookName._config(output_dir=Path("/out"), dpi=150)
+        skel = MagicMock(layer_name="comunas")
+        skel.export_settings = ReportComposer._export_settings(config)
+        assert skel.export_settings is not None
+        with patch(f"{self._MODULE}.QPdfWriter"), \
+                patch(f"{self._MODULE}.QPainter") as painter:
+            painter.return_value.isActive.return_value = True
+            composer._append_pdf_page(skel, config)
+
+        context = skel.layout.renderContext.return_value
+        context.setDpi.assert_called_once_with(150)
+        context.setFlags.assert_called_once_with(skel.export_settings.flags)
+        context.setTextRenderFormat.assert_called_once_with(
+            skel.export_settings.textRenderFormat
+        )
+        skel.exporter.renderPage.assert_called_once_with(
+            painter.return_value, 0
+        )
+
+    def test_close_reports_failed_end(self) -> None:
+        composer = self._composer()
+        assert composer._close_pdf_book()
+
+        book = composer._pdf_book = MagicMock()
+        book.painter.end.return_value = False
+        with self.assertLogs(self._MODULE, "ERROR"):
+            assert not composer._close_pdf_book()
+        assert composer._pdf_book is None
+
+
+class TestLocalityOrder(unittest.TestCase):
+    """Morton (Z-order) scheduling of features by bounding-box centre."""
+
+    @staticmethod
+    def _geom(x: float, y: float) -> MagicMock:
+        geom = MagicMock()
+        geom.isEmpty.return_value = False
+        centre = geom.boundingBox.return_value.center.return_value
+        centre.x.return_value = x
+        centre.y.return_value = y
+        return geom
+
+    def test_morton_code_interleaves_bits(self) -> None:
+        from autoatlas_pro.core.report_composer import _morton_code
+
+        assert [_morton_code(x, y) for x, y in
+                [(0, 0), (1, 0), (0, 1), (1, 1), (2, 0)]] == [0, 1, 2, 3, 4]
+        assert _morton_code(0xFFFF, 0xFFFF) == 0xFFFFFFFF
+
+    def test_quadrants_follow_z_order(self) -> None:
+        from autoatlas_pro.core.report_composer import ReportComposer
+
+        geometries = {
+            "ne": self._geom(10, 10),
+            "sw": self._geom(0, 0),
+            "nw": self._geom(0, 10),
+            "se": self._geom(10, 0),
+        }
+        order = ReportComposer._locality_order(list(geometries), geometries)
+        assert order == ["sw", "se", "nw", "ne"]
+
+    def test_features_without_geometry_go_last_in_order(self) -> None:
+        from autoatlas_pro.core.report_composer import ReportComposer
+
+        empty = MagicMock()
+        empty.isEmpty.return_value = True
+        geometries = {"b": self._geom(5, 5), "c": empty}
+        order = ReportComposer._locality_order(["x", "b", "c", "a"], geometries)
+        assert order == ["b", "x", "c", "a"]
+
+    def test_no_geometries_keeps_order(self) -> None:
+        from autoatlas_pro.core.report_composer import ReportComposer
+
+        assert ReportComposer._locality_order([3, 1, 2], {}) == [3, 1, 2]
+
+
+class TestDataEngineCaches(unittest.TestCase):
+    """DataEngine loads once per layer/fields and memoizes derived data."""
+
+    _ROWS = [
+        {"ID": 1, "NAME": "a", "POB": 10.0},
+        {"ID": 2, "NAME": "b", "POB": 40.0},
+        {"ID": 3, "NAME": "c", "POB": 20.0},
+        {"ID": 4, "NAME": "d", "POB": 30.0},
+        {"ID": 5, "NAME": "e", "POB": None},
+    ]
+
+    def setUp(self) -> None:
+        # The fake layer is no QgsFields source, so keep requests opaque
+        patcher = patch("autoatlas_pro.core.data_engine.QgsFeatureRequest")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _layer(self) -> MagicMock:
+        layer = MagicMock()
+        layer.isValid.return_value = True
+        layer.id.return_value = "comunas"
+        fields = []
+        for fname in self._ROWS[0]:
+            field = MagicMock()
+            field.name.return_value = fname
+            fields.append(field)
+        layer.fields.return_value = fields
+        layer.getFeatures.side_effect = lambda request: iter(self._ROWS)
+        return layer
+
+    def _engine(self, layer: MagicMock):
+        from autoatlas_pro.core.data_engine import DataEngine
+
+        engine = DataEngine()
+        engine.load(layer, "ID", "NAME", ["POB"])
+        return engine
+
+    def test_reload_is_skipped_until_invalidated(self) -> None:
+        layer = self._layer()
+        engine = self._engine(layer)
+        stats = engine.compute_stats("POB")
+
+        engine.load(layer, "ID", "NAME", ["POB"])
+        assert layer.getFeatures.call_count == 1
+        assert engine.compute_stats("POB") is stats
+
+        # The layer's dataChanged / updatedFields signals land here
+        layer.dataChanged.connect.assert_called_once_with(engine._invalidate)
+        engine._invalidate()
+        engine.load(layer, "ID", "NAME", ["POB"])
+        assert layer.getFeatures.call_count == 2
+        assert engine.compute_stats("POB") is not stats
+
+    def test_stats_and_ranking_are_memoized(self) -> None:
+        engine = self._engine(self._layer())
+        stats, ranking = engine.compute_stats_and_ranking("POB")
+
+        assert stats.count == 4
+        assert (stats.min_val, stats.max_val, stats.mean) == (10.0, 40.0, 25.0)
+        assert [r.feature_id for r in ranking] == [2, 4, 3, 1]
+        assert [r.rank for r in ranking] == [1, 2, 3, 4]
+        assert engine.compute_stats("POB") is stats
+        assert engine.compute_ranking("POB", ascending=False) is ranking
+        assert [r.name for r in engine.compute_ranking("POB")] == [
+            "a", "c", "d", "b",
+        ]
+
+    def test_unknown_field_raises(self) -> None:
+        engine = self._engine(self._layer())
+        with self.assertRaises(KeyError):
+            engine.compute_stats("MISSING")
+
+    def test_quantile_breaks_match_qgis(self) -> None:
+        from autoatlas_pro.core.models import GraduatedMode
+
+        # QgsClassificationQuantile on 1..10, 4 classes: (n + 1) p positions
+        self._ROWS = [
+            {"ID": i, "NAME": str(i), "POB": float(i)} for i in range(1, 11)
+        ]
+        engine = self._engine(self._layer())
+        assert engine.compute_class_breaks(
+            "POB", GraduatedMode.QUANTILE, 4
+        ) == [1.0, 2.75, 5.5, 8.25, 10.0]
+        # Outer bounds are the data range even where (n + 1) p falls outside
+        assert engine.compute_class_breaks(
+            "POB", GraduatedMode.QUANTILE, 20
+        )[::20] == [1.0, 10.0]
+
+    def test_class_breaks(self) -> None:
+        from autoatlas_pro.core.models import GraduatedMode
+
+        engine = self._engine(self._layer())
+        assert engine.compute_class_breaks(
+            "POB", GraduatedMode.EQUAL_INTERVAL, 3
+        ) == [10.0, 20.0, 30.0, 40.0]
+        assert engine.compute_class_breaks(
+            "POB", GraduatedMode.QUANTILE, 2
+        ) == [10.0, 25.0, 40.0]
+        # Left to the QGIS classifier, or nothing to classify
+        assert engine.compute_class_breaks("POB", GraduatedMode.JENKS, 3) is None
+        assert engine.compute_class_breaks(
+            "POB", GraduatedMode.QUANTILE, 0
+        ) is None
+        assert engine.compute_class_breaks(
+            "MISSING", GraduatedMode.QUANTILE, 3
+        ) is None
+
+
+class TestReportConfigValidation(unittest.TestCase):
+    """ReportConfig.__post_init__ rejects unusable tuning values."""
+
+    @staticmethod
+    def _config(**kwargs):
+        from autoatlas_pro.core.models import ReportConfig
+
+        return ReportConfig(
+            layer_id="comunas",
+            id_field="CUT_COM",
+            name_field="NOM_COM",
+            indicator_fields=["POB_TOTAL"],
+            **kwargs,
+        )
+
+    def test_gc_every_default(self) -> None:
+        assert self._config().gc_every == 50
+
+    def test_gc_every_must_be_positive(self) -> None:
+        assert self._config(gc_every=1).gc_every == 1
+        for bad in (0, -5):
+            with self.assertRaises(ValueError):
+                self._config(gc_every=bad)
+
+
 if __name__ == "__main__":
     unittest.main()
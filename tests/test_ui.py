@@ -0,0 +1,139 @@
+"""Unit tests for AutoAtlas Pro wizard UI logic.
+
+The dialog methods are exercised against a mocked view, so no widgets are
+created; importing the module still requires the QGIS Python bindings.
+"""
+
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+
+class TestPreviewBeforeOutputStep(unittest.TestCase):
+    """Preview is offered on the style step, before the output step exists."""
+
+    def test_output_page_built_before_config(self) -> None:
+        from autoatlas_pro.ui import wizard_dialog
+
+        view = MagicMock()
+        view._checked_indicators = {"POB_TOTAL": 0}
+        with patch.object(wizard_dialog, "QApplication"), \
+                patch.object(wizard_dialog, "PreviewDialog"), \
+                patch.object(wizard_dialog, "QMessageBox") as box:
+            wizard_dialog.WizardDialog._on_preview_clicked(view)
+
+        box.critical.assert_not_called()
+        calls = view.mock_calls
+        assert call._ensure_page(2) in calls
+        assert calls.index(call._ensure_page(2)) < calls.index(
+            call._controller.build_config()
+        )
+
+
+class TestMultipageBatchPaths(unittest.TestCase):
+    """A multi-page PDF batch reports one output file, not one per page."""
+
+    _BOOK = Path("/tmp/atlas.pdf")
+
+    def _controller(self) -> MagicMock:
+        from autoatlas_pro.core.models import OutputFormat, ReportConfig
+
+        ctrl = MagicMock()
+        ctrl._cancelled = False
+        ctrl._progress_task = None
+        ctrl._batch_config = ReportConfig(
+            layer_id="comunas",
+            id_field="CUT_COM",
+            name_field="NOM_COM",
+            indicator_fields=["POB_TOTAL"],
+            output_format=OutputFormat.PDF_MULTIPAGE,
+        )
+        ctrl._batch_ids = [1, 2, 3]
+        ctrl._batch_names = ["a", "b", "c"]
+        ctrl._batch_total = 3
+        ctrl._batch_index = 0
+        ctrl._batch_paths = []
+        ctrl._batch_errors = []
+        ctrl._render.return_value = self._BOOK
+        return ctrl
+
+    @staticmethod
+    def _run(ctrl: MagicMock) -> None:
+        from autoatlas_pro.ui.wizard_controller import WizardController
+
+        # One generous tick renders the whole batch and completes it
+        with patch("autoatlas_pro.ui.wizard_controller._TICK_BUDGET_S", 60):
+            WizardController.process_next_report(ctrl)
+
+    def test_book_path_recorded_once(self) -> None:
+        ctrl = self._controller()
+        self._run(ctrl)
+
+        assert ctrl._render.call_count == 3
+        assert ctrl._batch_paths == [self._BOOK]
+        ctrl._composer._close_pdf_book.assert_called_once_with()
+        ctrl.view._on_batch_complete.assert_called_once_with([self._BOOK], [])
+
+    def test_unfinished_book_is_an_error(self) -> None:
+        ctrl = self._controller()
+        ctrl._composer._close_pdf_book.return_value = False
+        ctrl.view.tr.side_effect = lambda text: text
+
+        self._run(ctrl)
+
+        ctrl.view._on_batch_complete.assert_called_once_with(
+            [], ["Could not finish the PDF: /tmp/atlas.pdf"]
+        )
+
+
+class TestFieldCacheSignals(unittest.TestCase):
+    """Cached field names follow layer edits; signals die with the dialog."""
+
+    @staticmethod
+    def _layer(layer_id: str) -> MagicMock:
+        layer = MagicMock()
+        layer.id.return_value = layer_id
+        return layer
+
+    def test_fields_update_refreshes_current_layer(self) -> None:
+        from autoatlas_pro.ui.wizard_dialog import WizardDialog
+
+        view = MagicMock()
+        layer = view._last_layer = self._layer("comunas")
+        view._field_cache = {"comunas": (["a"], []), "regiones": (["b"], [])}
+        WizardDialog._on_layer_fields_updated(view, "comunas")
+
+        assert view._field_cache == {"regiones": (["b"], [])}
+        view._on_layer_changed.assert_called_once_with(layer)
+
+    def test_fields_update_of_other_layer_keeps_combos(self) -> None:
+        from autoatlas_pro.ui.wizard_dialog import WizardDialog
+
+        view = MagicMock()
+        view._last_layer = self._layer("comunas")
+        view._field_cache = {"regiones": (["b"], [])}
+        WizardDialog._on_layer_fields_updated(view, "regiones")
+
+        assert view._field_cache == {}
+        view._on_layer_changed.assert_not_called()
+
+    def test_disconnect_layer_signals(self) -> None:
+        from autoatlas_pro.ui import wizard_dialog
+
+        view = MagicMock()
+        layer, slot = self._layer("comunas"), MagicMock()
+        view._field_cache_watched = {"comunas": (layer, slot)}
+        with patch.object(wizard_dialog, "QgsProject") as project:
+            wizard_dialog.WizardDialog._disconnect_layer_signals(view)
+
+        layer.updatedFields.disconnect.assert_called_once_with(slot)
+        project.instance().layersWillBeRemoved.disconnect.assert_called_once_with(
+            view._on_layers_will_be_removed
+        )
+        assert view._field_cache_watched == {}
+
+
+if __name__ == "__main__":
+    unittest.main()
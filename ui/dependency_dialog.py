@@ -6,10 +6,10 @@ with animated progress, status icons, and one-click install.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from qgis.PyQt.QtCore import QSize, Qt, QThread, pyqtSignal
-from qgis.PyQt.QtGui import QFont, QIcon
+from qgis.PyQt.QtGui import QColor, QFont, QPalette
 from qgis.PyQt.QtWidgets import (
     QDialog,
     QFrame,
@@ -23,11 +23,13 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
+from ..core.dependency_manager import OPTIONAL_DEPENDENCIES
+from ..core.models import DepStatus
+from .theme import DEPENDENCY_DIALOG_QSS
+
 if TYPE_CHECKING:
     from ..core.dependency_manager import DependencyInfo, DependencyManager
 
-from ..core.models import DepStatus
-
 
 # ======================================================================
 # Background installer thread
@@ -49,9 +51,9 @@ class _InstallerWorker(QThread):
         self._deps = deps
 
     def run(self) -> None:
-        for dep in self._deps:
-            status = self._manager.install(dep, self.progress.emit)
-            self.finished_dep.emit(dep.package_name, status)
+        self._manager.install_many(
+            self._deps, self.progress.emit, self.finished_dep.emit
+        )
         self.all_done.emit()
 
 
@@ -60,37 +62,32 @@ class _InstallerWorker(QThread):
 # ======================================================================
 
 
-class _DepCard(QFrame):
-    """A single dependency card showing name, description, and status."""
+def _status_palette(color: str) -> QPalette:
+    """Build a palette that only overrides the label text colour."""
+    palette = QPalette()
+    palette.setColor(QPalette.WindowText, QColor(color))
+    return palette
 
-    _STATUS_ICONS = {
-        DepStatus.INSTALLED: ("✅", "#2ecc71"),
-        DepStatus.MISSING: ("⚠️", "#f39c12"),
-        DepStatus.INSTALLING: ("🔄", "#3498db"),
-        DepStatus.ERROR: ("❌", "#e74c3c"),
-    }
 
-    _STATUS_LABELS = {
-        DepStatus.INSTALLED: "Installed",
-        DepStatus.MISSING: "Not installed",
-        DepStatus.INSTALLING: "Installing...",
-        DepStatus.ERROR: "Error",
-    }
+# (icon, label, palette) per status, built once at import; a status change
+# only swaps these in, with no colour allocation or rich-text parsing.
+_STATUS_STYLE: dict[DepStatus, tuple[str, str, QPalette]] = {
+    DepStatus.INSTALLED: ("✅", "Installed", _status_palette("#2ecc71")),
+    DepStatus.MISSING: ("⚠️", "Not installed", _status_palette("#f39c12")),
+    DepStatus.INSTALLING: ("🔄", "Installing...", _status_palette("#3498db")),
+    DepStatus.ERROR: ("❌", "Error", _status_palette("#e74c3c")),
+}
+_UNKNOWN_STYLE = ("❓", "Unknown", _status_palette("#95a5a6"))
+
+
+class _DepCard(QFrame):
+    """A single dependency card showing name, description, and status."""
 
     def __init__(self, dep: DependencyInfo, status: DepStatus) -> None:
         super().__init__()
         self._dep = dep
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet(
-            """
-            _DepCard {
-                background: palette(window);
-                border: 1px solid palette(mid);
-                border-radius: 8px;
-                padding: 12px;
-            }
-            """
-        )
+        self.setObjectName("dep_card")  # styled by DEPENDENCY_DIALOG_QSS
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
@@ -105,36 +102,45 @@ class _DepCard(QFrame):
         info_layout.addWidget(name_label)
 
         desc_label = QLabel(dep.description_en)
-        desc_label.setStyleSheet("color: palette(shadow);")
+        desc_label.setObjectName("dep_desc")
         desc_label.setWordWrap(True)
         info_layout.addWidget(desc_label)
         self._desc_label = desc_label
 
         if dep.min_version:
             ver_label = QLabel(f"Minimum version: {dep.min_version}")
-            ver_label.setStyleSheet("color: palette(shadow); font-size: 10px;")
+            ver_label.setObjectName("dep_version")
             info_layout.addWidget(ver_label)
 
         layout.addLayout(info_layout, stretch=1)
 
         # Right: status
+        status_layout = QVBoxLayout()
+        self._icon_label = QLabel()
+        self._icon_label.setAlignment(Qt.AlignCenter)
+        icon_font = QFont()
+        icon_font.setPixelSize(18)
+        self._icon_label.setFont(icon_font)
+        status_layout.addWidget(self._icon_label)
+
         self._status_label = QLabel()
         self._status_label.setAlignment(Qt.AlignCenter)
         self._status_label.setMinimumWidth(120)
-        layout.addWidget(self._status_label)
+        self._status_label.setTextFormat(Qt.PlainText)
+        status_font = QFont()
+        status_font.setBold(True)
+        self._status_label.setFont(status_font)
+        status_layout.addWidget(self._status_label)
+        layout.addLayout(status_layout)
 
         self.set_status(status)
 
     def set_status(self, status: DepStatus) -> None:
         """Update the visual status indicator."""
-        icon, color = self._STATUS_ICONS.get(
-            status, ("❓", "#95a5a6")
-        )
-        label = self._STATUS_LABELS.get(status, "Unknown")
-        self._status_label.setText(
-            f'<span style="font-size: 18px;">{icon}</span>'
-            f'<br><span style="color: {color}; font-weight: bold;">{label}</span>'
-        )
+        icon, label, palette = _STATUS_STYLE.get(status, _UNKNOWN_STYLE)
+        self._icon_label.setText(icon)
+        self._status_label.setText(label)
+        self._status_label.setPalette(palette)
 
     def set_description_locale(self, locale: str) -> None:
         """Switch description between 'en' and 'es'."""
@@ -164,15 +170,22 @@ class DependencyDialog(QDialog):
         self._manager = manager
         self._worker: _InstallerWorker | None = None
         self._cards: dict[str, _DepCard] = {}
+        # Status last shown on each card, so refreshes only touch changes
+        self._last_status: dict[str, DepStatus] = {}
+        self._all_ok_shown = False
+        self._installing: list[str] = []
 
         self.setWindowTitle("AutoAtlas Pro — Setup")
         self.setMinimumSize(QSize(520, 400))
         self.setModal(True)
+        # One sheet for the whole dialog, matched by objectName
+        self.setStyleSheet(DEPENDENCY_DIALOG_QSS)
 
-        self._build_ui()
-        self._refresh_status()
+        statuses = self._manager.check_all()
+        self._build_ui(statuses)
+        self._apply_statuses(statuses)
 
-    def _build_ui(self) -> None:
+    def _build_ui(self, statuses: dict[str, DepStatus]) -> None:
         root = QVBoxLayout(self)
         root.setSpacing(16)
         root.setContentsMargins(24, 24, 24, 24)
@@ -186,14 +199,27 @@ class DependencyDialog(QDialog):
         header.setWordWrap(True)
         root.addWidget(header)
 
-        # Cards
-        from ..core.dependency_manager import OPTIONAL_DEPENDENCIES
-
+        # Cards only for packages that still need attention; installed
+        # ones are summarised on a single line.
+        installed_names: list[str] = []
         for dep in OPTIONAL_DEPENDENCIES:
-            card = _DepCard(dep, DepStatus.MISSING)
+            status = statuses.get(dep.package_name, DepStatus.MISSING)
+            if status == DepStatus.INSTALLED:
+                installed_names.append(dep.package_name)
+                continue
+            card = _DepCard(dep, status)
             self._cards[dep.package_name] = card
+            self._last_status[dep.package_name] = status
             root.addWidget(card)
 
+        if installed_names:
+            installed_label = QLabel(
+                "Already installed: " + ", ".join(installed_names)
+            )
+            installed_label.setObjectName("dep_desc")
+            installed_label.setWordWrap(True)
+            root.addWidget(installed_label)
+
         # Progress bar (hidden by default)
         self._progress_bar = QProgressBar()
         self._progress_bar.setRange(0, 0)  # indeterminate
@@ -205,7 +231,7 @@ class DependencyDialog(QDialog):
         # Status message
         self._status_msg = QLabel("")
         self._status_msg.setWordWrap(True)
-        self._status_msg.setStyleSheet("color: palette(shadow); font-style: italic;")
+        self._status_msg.setObjectName("status_hint")
         root.addWidget(self._status_msg)
 
         # Spacer
@@ -215,9 +241,7 @@ class DependencyDialog(QDialog):
         btn_layout = QHBoxLayout()
 
         self._skip_btn = QPushButton("Skip — Use basic charts")
-        self._skip_btn.setStyleSheet(
-            "QPushButton { padding: 8px 20px; border-radius: 4px; }"
-        )
+        self._skip_btn.setObjectName("skip_secondary")
         self._skip_btn.clicked.connect(self._on_skip)
         btn_layout.addWidget(self._skip_btn)
 
@@ -226,20 +250,7 @@ class DependencyDialog(QDialog):
         )
 
         self._install_btn = QPushButton("⬇ Install All")
-        self._install_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                font-weight: bold;
-                padding: 8px 24px;
-                border-radius: 4px;
-                border: none;
-            }
-            QPushButton:hover { background-color: #27ae60; }
-            QPushButton:disabled { background-color: #95a5a6; }
-            """
-        )
+        self._install_btn.setObjectName("install_primary")
         self._install_btn.clicked.connect(self._on_install_all)
         btn_layout.addWidget(self._install_btn)
 
@@ -249,19 +260,48 @@ class DependencyDialog(QDialog):
     # Actions
     # ------------------------------------------------------------------
 
-    def _refresh_status(self) -> None:
-        """Re-check dependency statuses and update cards."""
-        statuses = self._manager.check_all()
-        for pkg_name, status in statuses.items():
-            if pkg_name in self._cards:
-                self._cards[pkg_name].set_status(status)
+    def _refresh_status(self, packages: Iterable[str] | None = None) -> None:
+        """Re-check dependency statuses and update cards.
+
+        Args:
+            packages: Only re-probe these packages (others keep their
+                cached status); None re-checks every dependency.
+        """
+        if packages is None:
+            statuses = self._manager.check_all()
+        else:
+            for pkg_name in packages:
+                self._manager.check_one(pkg_name)
+            statuses = self._manager.statuses
+        self._apply_statuses(statuses)
+
+    def _apply_statuses(self, statuses: dict[str, DepStatus]) -> None:
+        """Show ``statuses`` on the cards and the install button."""
+        self.setUpdatesEnabled(False)  # coalesce card repaints
+        try:
+            for pkg_name, status in statuses.items():
+                self._show_status(pkg_name, status)
+        finally:
+            self.setUpdatesEnabled(True)
 
         all_ok = all(s == DepStatus.INSTALLED for s in statuses.values())
-        if all_ok:
+        if all_ok and not self._all_ok_shown:
+            self._all_ok_shown = True
             self._install_btn.setEnabled(False)
             self._install_btn.setText("✅ All installed")
             self._status_msg.setText("All dependencies are installed. You're all set!")
 
+    def _show_status(self, pkg_name: str, status: DepStatus) -> None:
+        """Update a card's indicator only if its status changed.
+
+        Installed-at-open packages have no card and are ignored.
+        """
+        card = self._cards.get(pkg_name)
+        if card is None or self._last_status.get(pkg_name) == status:
+            return
+        card.set_status(status)
+        self._last_status[pkg_name] = status
+
     def _on_skip(self) -> None:
         """User chose to skip dependency installation."""
         self._manager.dismiss_prompt()
@@ -279,9 +319,9 @@ class DependencyDialog(QDialog):
         self._progress_bar.setVisible(True)
 
         for dep in missing:
-            if dep.package_name in self._cards:
-                self._cards[dep.package_name].set_status(DepStatus.INSTALLING)
+            self._show_status(dep.package_name, DepStatus.INSTALLING)
 
+        self._installing = [dep.package_name for dep in missing]
         self._worker = _InstallerWorker(self._manager, missing)
         self._worker.progress.connect(self._on_progress)
         self._worker.finished_dep.connect(self._on_dep_finished)
@@ -292,13 +332,13 @@ class DependencyDialog(QDialog):
         self._status_msg.setText(msg)
 
     def _on_dep_finished(self, pkg_name: str, status: object) -> None:
-        if pkg_name in self._cards:
-            self._cards[pkg_name].set_status(status)  # type: ignore[arg-type]
+        self._show_status(pkg_name, status)  # type: ignore[arg-type]
 
     def _on_all_done(self) -> None:
         self._progress_bar.setVisible(False)
         self._skip_btn.setEnabled(True)
-        self._refresh_status()
+        # Only the packages just installed can have changed
+        self._refresh_status(self._installing)
         self._manager.dismiss_prompt()
 
     # ------------------------------------------------------------------
@@ -7,8 +7,14 @@ Design principles:
 - All colors target WCAG AA contrast ratio (4.5:1 minimum for text).
 - No QGraphicsOpacityEffect: it causes text-ghosting artefacts in Qt
   when applied to container widgets with complex children.
+- Apply through ``apply_theme`` on our dialog roots, never on the
+  QApplication: an application-wide sheet would restyle all of QGIS.
 """
 
+import re
+
+from qgis.PyQt.QtWidgets import QWidget
+
 DARK_CORPORATE_QSS = """
 /* ─── Dialog root ─── */
 QDialog {
@@ -113,7 +119,6 @@ QPushButton:disabled {
 /* ─── Tables & Lists ─── */
 QTableWidget, QListWidget {
     background-color: #1E293B;
-    alternate-background-color: #273548;
     color: #F1F5F9;
     gridline-color: #334155;
     border: 1px solid #3B4F6B;
@@ -185,3 +190,46 @@ QProgressBar::chunk {
     border-radius: 3px;
 }
 """
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt parses less text."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{};])\s*", r"\1", qss).strip()
+
+
+# Minified once at import; the readable source above stays the reference.
+DARK_CORPORATE_QSS = _minify_qss(DARK_CORPORATE_QSS)
+
+
+# Native-palette look for the dependency installer; widgets opt in by
+# objectName so no per-widget sheets need parsing.
+DEPENDENCY_DIALOG_QSS = _minify_qss("""
+QFrame#dep_card {
+    background: palette(window);
+    border: 1px solid palette(mid);
+    border-radius: 8px;
+    padding: 12px;
+}
+QLabel#dep_desc { color: palette(shadow); }
+QLabel#dep_version { color: palette(shadow); font-size: 10px; }
+QLabel#status_hint { color: palette(shadow); font-style: italic; }
+
+QPushButton#skip_secondary { padding: 8px 20px; border-radius: 4px; }
+QPushButton#install_primary {
+    background-color: #2ecc71;
+    color: white;
+    font-weight: bold;
+    padding: 8px 24px;
+    border-radius: 4px;
+    border: none;
+}
+QPushButton#install_primary:hover { background-color: #27ae60; }
+QPushButton#install_primary:disabled { background-color: #95a5a6; }
+""")
+
+
+def apply_theme(widget: QWidget) -> None:
+    """Apply the dark corporate theme to ``widget`` and its children."""
+    widget.setStyleSheet(DARK_CORPORATE_QSS)
@@ -1,19 +1,26 @@
 """Controller for WizardDialog in AutoAtlas Pro."""
 
+import gc
+import logging
+import time
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from qgis.PyQt.QtCore import Qt, QTimer
-from qgis.PyQt.QtWidgets import QApplication
+from qgis.core import QgsApplication, QgsProxyProgressTask
+from qgis.PyQt.QtCore import QTimer
 
 from ..core.models import (
-    ChartType,
-    ContextLayerConfig,
     MapStyle,
     OutputFormat,
     ReportConfig,
 )
-from ..core.report_composer import ReportComposer
+from ..core.report_composer import GcPolicy, ReportComposer
+
+_log = logging.getLogger(__name__)
+
+# Reports rendered per event-loop tick stop once this many seconds pass
+_TICK_BUDGET_S = 0.05
 
 
 class WizardController:
@@ -37,24 +44,55 @@ class WizardController:
         self._batch_stats = None
         self._batch_ranking = None
         self._batch_ids: List = []
+        self._batch_names: List[str] = []  # aligned with _batch_ids
         self._batch_index = 0
         self._batch_total = 0
         self._batch_template = None
         self._batch_base_layer = None
+        self._batch_geometries: Dict = {}
+        # Hot-loop callables bound once per batch in start_generation
+        self._render: Optional[Callable[..., Path]] = None
+        self._geometry_get: Optional[Callable] = None
+        # One zero-interval timer re-armed per report: a queued self-post
+        # without creating and destroying a QTimer each time
+        self._next_timer = QTimer()
+        self._next_timer.setSingleShot(True)
+        self._next_timer.setInterval(0)
+        self._next_timer.timeout.connect(self.process_next_report)
+        # Mirrors the batch in the QGIS task manager (progress + cancel)
+        self._progress_task: Optional[QgsProxyProgressTask] = None
+        # Decides on collections between reports, created per batch
+        self._gc_policy: Optional[GcPolicy] = None
+        # Whether start_generation froze the heap (cleanup thaws it)
+        self._gc_frozen = False
+
+        # Progress is painted at most every 100 ms, not once per report
+        self._pending_progress: Optional[Tuple[int, str]] = None
+        self._ui_timer = QTimer()
+        self._ui_timer.setInterval(100)
+        self._ui_timer.timeout.connect(self._flush_progress)
+
+    def _get_composer(self) -> ReportComposer:
+        """Return the composer shared by previews and batches.
+
+        Reusing it keeps the DataEngine caches, so a batch run after a
+        preview of the same layer and fields skips reloading the data.
+        """
+        if self._composer is None:
+            self._composer = ReportComposer()
+        return self._composer
 
-    def validate_step_data(self) -> bool:
-        """Validate step 1 (Data) input before proceeding."""
+    def validate_step_data(self) -> Tuple[bool, str]:
+        """Validate step 1 (Data) input before proceeding.
+
+        Returns:
+            ``(True, "")`` when valid, else ``(False, message)``.
+        """
         layer = self.view._layer_combo.currentLayer()
         if not layer:
             return False, self.view.tr("Please select a coverage layer.")
-            
-        has_indic = False
-        for i in range(self.view._indicator_list.count()):
-            if self.view._indicator_list.item(i).checkState() == Qt.Checked:
-                has_indic = True
-                break
-        
-        if not has_indic:
+
+        if not self.view._checked_indicators:
             return False, self.view.tr("Please select at least one indicator field.")
 
         return True, ""
@@ -63,11 +101,7 @@ class WizardController:
         """Builds a ReportConfig securely reading from UI Widgets in the view."""
         layer = self.view._layer_combo.currentLayer()
 
-        indicator_fields = []
-        for i in range(self.view._indicator_list.count()):
-            item = self.view._indicator_list.item(i)
-            if item.checkState() == Qt.Checked:
-                indicator_fields.append(item.text())
+        indicator_fields = self.view._checked_indicator_fields()
 
         map_style = self.view._style_combo.currentData()
         base_map = self.view._basemap_combo.currentData()
@@ -79,17 +113,7 @@ class WizardController:
         if self.view._chk_labels.isChecked():
             label_field = self.view._label_field_combo.currentField()
             
-        context_configs: List[ContextLayerConfig] = []
-        for i in range(self.view._ctx_table.rowCount()):
-            chk = self.view._ctx_table.item(i, 0)
-            if chk and chk.checkState() == Qt.Checked:
-                lid = chk.data(Qt.UserRole)
-                alias = (self.view._ctx_table.item(i, 2).text() or "").strip()
-                spin = self.view._ctx_table.cellWidget(i, 3)
-                opa = spin.value() if spin else 1.0
-                context_configs.append(
-                    ContextLayerConfig(layer_id=lid, legend_alias=alias, opacity=opa)
-                )
+        context_configs = self.view._checked_context_layers()
 
         show_overview_map = self.view._chk_overview.isChecked()
         show_overview_labels = self.view._chk_overview_labels.isChecked()
@@ -106,7 +130,12 @@ class WizardController:
         logo_pos = self.view._logo_pos_combo.currentText()
         variable_alias = self.view._alias_edit.text().strip()
 
-        output_format = OutputFormat.PDF if self.view._radio_pdf.isChecked() else OutputFormat.PNG
+        if self.view._radio_pdf.isChecked():
+            output_format = OutputFormat.PDF
+        elif self.view._radio_pdf_multi.isChecked():
+            output_format = OutputFormat.PDF_MULTIPAGE
+        else:
+            output_format = OutputFormat.PNG
         output_dir = Path(self.view._dir_edit.text().strip())
 
         ramp_name = "Spectral"
@@ -170,98 +199,215 @@ class WizardController:
         self._consecutive_errors = 0
 
         try:
-            self._composer = ReportComposer()
-            layer = self._composer._resolve_layer(config.layer_id)
-            self._batch_layer = layer
-            self._composer._data_engine.load(
-                layer, config.id_field, config.name_field, config.indicator_fields,
-            )
+            self._prepare_batch(config)
+        except Exception as exc:
+            # The view's error handler runs cleanup(), which releases any
+            # layout and base map layer created before the failure.
+            self.view._on_batch_error(str(exc))
+            return
 
-            primary = config.indicator_fields[0]
-            self._batch_primary = primary
+        # Layouts must render on the main thread, so the batch stays on
+        # the event loop; a proxy task surfaces it in the task manager.
+        self._progress_task = QgsProxyProgressTask(
+            self.view.tr("AutoAtlas Pro: generating {n} reports").format(
+                n=self._batch_total
+            ),
+            canCancel=True,
+        )
+        QgsApplication.taskManager().addTask(self._progress_task)
+
+        # Move everything alive now (QGIS, Qt wrappers, the loaded data)
+        # to the permanent generation so batch collections skip it.
+        # Automatic collection stays on between reports; it is paused
+        # only while each one renders.
+        gc.collect()
+        gc.freeze()
+        self._gc_frozen = True
+        self._gc_policy = GcPolicy(config.gc_every)
+
+        # Start Async Loop
+        self._ui_timer.start()
+        self._next_timer.start()
+
+    def _prepare_batch(self, config: ReportConfig) -> None:
+        """Load data and build every batch-constant object.
+
+        Cheap checks that touch no project state run first.  On failure
+        partially built state is left in place for ``cleanup`` to release.
+        """
+        config.output_dir.mkdir(parents=True, exist_ok=True)
+
+        composer = self._get_composer()
+        layer = composer._resolve_layer(config.layer_id)
+        self._batch_layer = layer
+        composer._data_engine.load(
+            layer, config.id_field, config.name_field, config.indicator_fields,
+        )
 
-            self._composer._apply_renderer(layer, config, primary)
+        primary = config.indicator_fields[0]
+        self._batch_primary = primary
 
-            self._batch_stats = self._composer._data_engine.compute_stats(primary)
-            self._batch_ranking = self._composer._data_engine.compute_ranking(
-                primary, ascending=False,
-            )
+        composer._apply_renderer(layer, config, primary)
 
-            feature_ids = config.feature_ids or self._composer._data_engine.feature_ids
-            self._batch_ids = list(feature_ids)
-            self._batch_index = 0
-            self._batch_total = len(self._batch_ids)
-            self._batch_template = config.template or None
-            
-            self._batch_base_layer = self._composer._create_base_map_layer(config.base_map)
+        self._batch_stats, self._batch_ranking = (
+            composer._data_engine.compute_stats_and_ranking(primary)
+        )
+
+        feature_ids = config.feature_ids or composer._data_engine.feature_ids
+        self._batch_ids = list(feature_ids)
+        self._batch_index = 0
+        self._batch_total = len(self._batch_ids)
+        # Resolved once; the layout skeleton cache keys on its identity
+        self._batch_template = (
+            config.template or composer._resolve_template()
+        )
+        # One sequential scan instead of a filtered query per report
+        self._batch_geometries = composer._collect_feature_geometries(
+            layer, config.id_field, self._batch_ids,
+        )
+        if config.schedule_by_locality:
+            self._batch_ids = composer._locality_order(
+                self._batch_ids, self._batch_geometries,
+            )
 
-            self.view._progress_bar.setRange(0, self._batch_total)
-            self.view._progress_bar.setValue(0)
+        # Names resolved once, in final (possibly locality) order
+        self._batch_names = composer._data_engine.feature_names(self._batch_ids)
 
-            config.output_dir.mkdir(parents=True, exist_ok=True)
+        self._batch_base_layer = composer._create_base_map_layer(config.base_map)
 
-            # Start Async Loop
-            QTimer.singleShot(0, self.process_next_report)
+        # Every batch-constant argument bound once, not looked up per report
+        self._render = partial(
+            composer._generate_single, config, layer,
+            self._batch_template,
+            primary_field=primary,
+            stats=self._batch_stats,
+            ranking=self._batch_ranking,
+            base_layer=self._batch_base_layer,
+        )
+        self._geometry_get = self._batch_geometries.get
 
-        except Exception as exc:
-            self.view._on_batch_error(str(exc))
+        # The minimum never changes; reset() clears the previous run's value
+        progress_bar = self.view._progress_bar
+        progress_bar.reset()
+        progress_bar.setMaximum(self._batch_total)
 
     def process_next_report(self) -> None:
-        """Process one report, check circuit breaker, and schedule the next."""
+        """Process reports for one event-loop tick, then schedule the next.
+
+        Reports run back to back until ``_TICK_BUDGET_S`` has elapsed, so
+        fast reports share a tick while slow ones still yield after each.
+        Checks the circuit breaker after every failure.
+        """
+        task = self._progress_task
+        if task is not None and task.isCanceled():
+            self._cancelled = True
         if getattr(self, '_cancelled', False):
             self.view._on_batch_cancelled()
             return
 
-        if self._batch_index >= self._batch_total:
-            self.view._on_batch_complete(self._batch_paths, self._batch_errors)
-            return
-
-        fid = self._batch_ids[self._batch_index]
-        name = self._composer._data_engine._names_cache.get(fid, str(fid))
-
-        self.view.update_progress(
-            self._batch_index + 1, self._batch_total, name
+        # Loop-invariant lookups hoisted out of the per-report loop
+        render = self._render
+        geometry_get = self._geometry_get
+        ids = self._batch_ids
+        names = self._batch_names
+        total = self._batch_total
+        gc_policy = self._gc_policy
+        gc_paused = gc_policy.paused
+        # Every page of a multi-page PDF returns the same book path
+        multipage = (
+            self._batch_config.output_format == OutputFormat.PDF_MULTIPAGE
         )
-
-        try:
-            path = self._composer._generate_single(
-                self._batch_config,
-                self._batch_layer,
-                self._batch_template or self._composer._resolve_template(),
-                fid,
-                name,
-                self._batch_primary,
-                self._batch_stats,
-                self._batch_ranking,
-                self._batch_base_layer,
-            )
-            self._batch_paths.append(path)
-            self._consecutive_errors = 0  # Reset on success
-        except Exception as exc:
-            import traceback
-            traceback.print_exc()
-            self._batch_errors.append(f"{name}: {exc}")
-            self._consecutive_errors += 1
-            # Circuit Breaker: If we accumulated 3 consecutive direct errors, break
-            if self._consecutive_errors >= 3:
-                self.view._on_batch_error(self.view.tr("Circuit Breaker Tripped: Demasiados errores de renderizado consecutivos."))
+        monotonic = time.monotonic
+
+        deadline = monotonic() + _TICK_BUDGET_S
+        while True:
+            if self._batch_index >= total:
+                # Paint the last report's progress the throttle may have held
+                self._flush_progress()
+                # Finish the book now so a failed write is not reported
+                # as generated (cleanup() would close it silently)
+                if (
+                    multipage and self._batch_paths
+                    and not self._composer._close_pdf_book()
+                ):
+                    self._batch_errors.append(
+                        self.view.tr("Could not finish the PDF: {path}").format(
+                            path=self._batch_paths[0]
+                        )
+                    )
+                    self._batch_paths = []
+                self.view._on_batch_complete(self._batch_paths, self._batch_errors)
                 return
 
-        self._batch_index += 1
+            index = self._batch_index
+            fid = ids[index]
+            name = names[index]
 
-        if self._batch_index % 10 == 0:
-            import gc
-            gc.collect()
+            self._pending_progress = (index + 1, name)
+
+            try:
+                with gc_paused():
+                    path = render(fid, name, geometry=geometry_get(fid))
+                if not (multipage and self._batch_paths):
+                    self._batch_paths.append(path)
+                self._consecutive_errors = 0  # Reset on success
+            except Exception as exc:
+                # The traceback is only formatted when debug logging is on
+                _log.debug("report %s failed", name, exc_info=True)
+                self._batch_errors.append(f"{name}: {exc}")
+                self._consecutive_errors += 1
+                # Circuit Breaker: If we accumulated 3 consecutive direct errors, break
+                if self._consecutive_errors >= 3:
+                    self.view._on_batch_error(self.view.tr("Circuit Breaker Tripped: Demasiados errores de renderizado consecutivos."))
+                    return
+
+            self._batch_index += 1
+            gc_policy.step(index)
+
+            if monotonic() >= deadline:
+                break
 
-        QTimer.singleShot(0, self.process_next_report)
+        self._next_timer.start()
+
+    def _flush_progress(self) -> None:
+        """Show the latest pending progress (driven by ``_ui_timer``)."""
+        pending = self._pending_progress
+        if pending is None:
+            return
+        self._pending_progress = None
+        current, name = pending
+        self.view.update_progress(current, self._batch_total, name)
+        if self._progress_task is not None:
+            self._progress_task.setProxyProgress(
+                100.0 * (current - 1) / self._batch_total
+            )
 
     def cancel_generation(self) -> None:
         self._cancelled = True
 
     def cleanup(self) -> None:
+        self._next_timer.stop()
+        if self._gc_frozen:
+            self._gc_frozen = False
+            gc.unfreeze()
+            # One full sweep for the batch's garbage and the thawed heap
+            gc.collect()
+        self._gc_policy = None
+        self._ui_timer.stop()
+        self._pending_progress = None
+        if self._progress_task is not None:
+            self._progress_task.finalize(
+                not self._cancelled and self._batch_index >= self._batch_total
+            )
+            self._progress_task = None
+        if self._composer:
+            self._composer._release_layout()
         if self._batch_base_layer and self._composer:
             try:
                 self._composer._project.removeMapLayer(self._batch_base_layer.id())
             except Exception:
                 pass
             self._batch_base_layer = None
+        self._batch_geometries = {}
+        self._batch_names = []
+        self._render = self._geometry_get = None
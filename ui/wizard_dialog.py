@@ -8,16 +8,18 @@ Three-step workflow:
 
 from __future__ import annotations
 
+import logging
+from contextlib import contextmanager
 from pathlib import Path
-import tempfile
-from typing import TYPE_CHECKING, List, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+from .theme import apply_theme
 from .wizard_controller import WizardController
 
 from qgis.core import (
     QgsMapLayerProxyModel,
     QgsProject,
-    QgsStyle,
     QgsVectorLayer,
 )
 from qgis.gui import (
@@ -26,21 +28,22 @@ from qgis.gui import (
     QgsOpacityWidget,
     QgsMapLayerComboBox,
 )
-from qgis.PyQt.QtCore import QCoreApplication, QSize, Qt
-from qgis.PyQt.QtGui import QColor, QFont, QIcon, QPixmap
+from qgis.PyQt.QtCore import QCoreApplication, QSize, Qt, QVariant
+from qgis.PyQt.QtGui import QColor, QFont, QImage, QPixmap
 from qgis.PyQt.QtWidgets import (
+    QApplication,
     QCheckBox,
     QComboBox,
     QDialog,
     QDoubleSpinBox,
     QFileDialog,
     QFrame,
-
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
@@ -59,14 +62,16 @@ from qgis.PyQt.QtWidgets import (
 )
 
 if TYPE_CHECKING:
-    from qgis.gui import (
-        QgisInterface,
-        QgsColorButton,
-        QgsFieldComboBox,
-        QgsMapLayerComboBox,
-        QgsOpacityWidget,
-        QgsVectorLayer,
-    )
+    from qgis.gui import QgisInterface
+
+# Field types QgsField.isNumeric() accepts, matched without a call per field
+_NUMERIC_FIELD_TYPES = frozenset({
+    QVariant.Int,
+    QVariant.UInt,
+    QVariant.LongLong,
+    QVariant.ULongLong,
+    QVariant.Double,
+})
 
 TRANS_UI = {
     "es": {
@@ -106,6 +111,7 @@ TRANS_UI = {
         "step3_title": "Configuración de Salida",
         "step3_desc": "Elige formato y destino.",
         "grp_format": "Formato de Salida",
+        "pdf_multipage": "PDF (un solo archivo multipágina)",
         "grp_dir": "Directorio de Salida",
         "browse": "Examinar...",
         "next": "Siguiente >",
@@ -152,6 +158,7 @@ TRANS_UI = {
         "step3_title": "Output Configuration",
         "step3_desc": "Choose format and destination.",
         "grp_format": "Output Format",
+        "pdf_multipage": "PDF (single multi-page file)",
         "grp_dir": "Output Directory",
         "browse": "Browse...",
         "next": "Next >",
@@ -165,19 +172,42 @@ TRANS_UI = {
 
 from ..core.models import (
     BaseMapType,
-    ChartType,
     ContextLayerConfig,
     GraduatedMode,
     MapStyle,
-    OutputFormat,
-    ReportConfig,
-    TemplateConfig,
 )
 
+# (label, data) pairs for the base map combo, enumerated once at import
+_BASE_MAP_ITEMS = [(bm.value, bm) for bm in BaseMapType]
+
+_log = logging.getLogger(__name__)
+
 
 class WizardDialog(QDialog):
     """Three-step wizard for configuring and launching report generation."""
 
+    # Per-widget sheets, defined once per process rather than per build
+    _FOOTER_QSS = "QFrame { border-top: 1px solid palette(mid); padding: 12px; }"
+    _NEXT_BTN_QSS = """
+        QPushButton {
+            background-color: #0f3460;
+            color: white;
+            font-weight: bold;
+            padding: 8px 24px;
+            border-radius: 4px;
+            border: none;
+        }
+        QPushButton:hover { background-color: #1a4a7a; }
+        QPushButton:disabled { background-color: #95a5a6; }
+    """
+    _PROGRESS_LABEL_QSS = "font-style: italic; color: gray;"
+    # Step label colours: (current, done, upcoming)
+    _STEP_LABEL_QSS = (
+        "color: white;",
+        "color: rgba(255,255,255,0.7);",
+        "color: rgba(255,255,255,0.4);",
+    )
+
     def __init__(
         self,
         iface: QgisInterface,
@@ -186,20 +216,48 @@ class WizardDialog(QDialog):
         super().__init__(parent)
         self._iface = iface
         self._current_step = 0
+        self._generating = False  # the Next button cancels while True
+        self._last_layer: Optional[QgsVectorLayer] = None
         self._controller = WizardController(self)
+        # layer id -> (all field names, numeric field names)
+        self._field_cache: Dict[str, Tuple[List[str], List[str]]] = {}
+        # layer id -> (layer, updatedFields slot), disconnected in done()
+        self._field_cache_watched: Dict[
+            str, Tuple[QgsVectorLayer, Callable[[], None]]
+        ] = {}
+        QgsProject.instance().layersWillBeRemoved.connect(
+            self._on_layers_will_be_removed
+        )
 
         self.setWindowTitle(self.tr("AutoAtlas Pro — Report Wizard"))
         self.setMinimumSize(QSize(680, 520))
         self.setModal(True)
-        
-        from .theme import DARK_CORPORATE_QSS
-        self.setStyleSheet(DARK_CORPORATE_QSS)
+
+        apply_theme(self)
 
         self._build_ui()
 
     def tr(self, message: str) -> str:
         return QCoreApplication.translate("WizardDialog", message)
 
+    @contextmanager
+    def _batch_ui(self, *widgets: QWidget) -> Iterator[None]:
+        """Silence signals and repaints of ``widgets`` for a bulk update.
+
+        Each widget's previous state is restored on exit, so blocks nest;
+        re-enabling updates schedules the single repaint.
+        """
+        saved = [(w, w.signalsBlocked(), w.updatesEnabled()) for w in widgets]
+        for w in widgets:
+            w.blockSignals(True)
+            w.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for w, blocked, enabled in reversed(saved):
+                w.blockSignals(blocked)
+                w.setUpdatesEnabled(enabled)
+
     # ==================================================================
     # UI Construction
     # ==================================================================
@@ -214,11 +272,16 @@ class WizardDialog(QDialog):
         root.addWidget(self._header)
 
         # --- Stacked content area ---
+        # Steps 2 and 3 start as placeholders and are built on first visit
         self._stack = QStackedWidget()
         self._stack.addWidget(self._build_step_data())
-        self._stack.addWidget(self._build_step_style())
-        self._stack.addWidget(self._build_step_output())
-        
+        self._page_factories: Dict[int, Callable[[], QWidget]] = {
+            1: self._build_step_style,
+            2: self._build_step_output,
+        }
+        for _ in self._page_factories:
+            self._stack.addWidget(QWidget())
+
         root.addWidget(self._stack, stretch=1)
 
         # --- Footer with navigation buttons ---
@@ -228,6 +291,16 @@ class WizardDialog(QDialog):
         # Initial UI text update (defaults to Spanish)
         self._update_ui_text()
 
+    def _ensure_page(self, index: int) -> None:
+        """Swap the placeholder at ``index`` for its real page, once."""
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return
+        placeholder = self._stack.widget(index)
+        self._stack.insertWidget(index, factory())
+        self._stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     # ------------------------------------------------------------------
     # Header (step indicator)
     # ------------------------------------------------------------------
@@ -245,37 +318,29 @@ class WizardDialog(QDialog):
             self.tr("② Style"),
             self.tr("③ Output"),
         ]
-        for i, text in enumerate(steps):
+        # Shared by all labels; step changes only swap these in
+        self._font_bold = QFont("Arial", 12, QFont.Bold)
+        self._font_normal = QFont("Arial", 12, QFont.Normal)
+        for text in steps:
             lbl = QLabel(text)
             lbl.setAlignment(Qt.AlignCenter)
-            font = QFont("Arial", 12, QFont.Bold if i == 0 else QFont.Normal)
-            lbl.setFont(font)
-            lbl.setStyleSheet(
-                "color: white;" if i == 0 else "color: rgba(255,255,255,0.5);"
-            )
             self._step_labels.append(lbl)
             layout.addWidget(lbl)
+        self._update_step_indicator()
 
         return header
 
     def _update_step_indicator(self) -> None:
         """Update the visual state of step labels based on current step."""
+        current = self._current_step
+        current_qss, done_qss, upcoming_qss = self._STEP_LABEL_QSS
         for i, lbl in enumerate(self._step_labels):
-            if i == self._current_step:
-                lbl.setStyleSheet("color: white;")
-                font = lbl.font()
-                font.setBold(True)
-                lbl.setFont(font)
-            elif i < self._current_step:
-                lbl.setStyleSheet("color: rgba(255,255,255,0.7);")
-                font = lbl.font()
-                font.setBold(False)
-                lbl.setFont(font)
+            if i == current:
+                lbl.setStyleSheet(current_qss)
+                lbl.setFont(self._font_bold)
             else:
-                lbl.setStyleSheet("color: rgba(255,255,255,0.4);")
-                font = lbl.font()
-                font.setBold(False)
-                lbl.setFont(font)
+                lbl.setStyleSheet(done_qss if i < current else upcoming_qss)
+                lbl.setFont(self._font_normal)
 
     # ------------------------------------------------------------------
     # Step 1: Data Selection
@@ -310,14 +375,12 @@ class WizardDialog(QDialog):
         self._grp_layer = QGroupBox(self.tr("Coverage Layer"))
         grp_layout = QVBoxLayout(self._grp_layer)
 
-        from qgis.gui import QgsMapLayerComboBox
         self._layer_combo = QgsMapLayerComboBox()
         self._layer_combo.setFilters(
             QgsMapLayerProxyModel.PolygonLayer |
             QgsMapLayerProxyModel.PointLayer |
             QgsMapLayerProxyModel.LineLayer
         )
-        self._layer_combo.layerChanged.connect(self._on_layer_changed)
         grp_layout.addWidget(self._layer_combo)
         layout.addWidget(self._grp_layer)
 
@@ -354,13 +417,25 @@ class WizardDialog(QDialog):
         self._indicator_list = QListWidget()
         self._indicator_list.setSelectionMode(QListWidget.MultiSelection)
         self._indicator_list.setMaximumHeight(150)
+        # Every row is one line of text: skip per-item size hints and lay
+        # out wide layers in chunks between events
+        self._indicator_list.setUniformItemSizes(True)
+        self._indicator_list.setLayoutMode(QListView.Batched)
+        self._indicator_list.setBatchSize(100)
         fields_layout.addWidget(self._indicator_list)
+        # Checked indicator name → list row, kept current by itemChanged so
+        # validation and config building need not scan every item.
+        self._checked_indicators: Dict[str, int] = {}
+        self._indicator_list.itemChanged.connect(self._on_indicator_toggled)
 
         layout.addWidget(self._grp_fields)
         layout.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
 
         # Populate if a layer is already selected
+        # Populate once, then follow changes: connecting first could run
+        # the handler twice, or before the field widgets exist.
         self._on_layer_changed(self._layer_combo.currentLayer())
+        self._layer_combo.layerChanged.connect(self._on_layer_changed)
 
         return page
 
@@ -385,33 +460,111 @@ class WizardDialog(QDialog):
 
     def _on_layer_changed(self, layer: Optional[QgsVectorLayer]) -> None:
         """Populate field combos when layer selection changes."""
-        self._id_field_combo.clear()
-        self._name_field_combo.clear()
-        self._indicator_list.clear()
-        
+        if layer is self._last_layer:
+            return
+        self._last_layer = layer
+
         # Update Categorized Column Combo (only if Step 2 is built)
         if hasattr(self, "_cat_col_combo"):
             self._cat_col_combo.setLayer(layer)
 
-        if not layer:
-            return
+        with self._batch_ui(
+            self._id_field_combo, self._name_field_combo, self._indicator_list
+        ):
+            self._id_field_combo.clear()
+            self._name_field_combo.clear()
+            self._indicator_list.clear()
+            self._checked_indicators.clear()
 
-        fields = layer.fields()
-        for f in fields:
-            fname = f.name()
-            self._id_field_combo.addItem(fname)
-            self._name_field_combo.addItem(fname)
-
-            # Only show numeric fields in indicator list
-            if f.isNumeric():
-                item = QListWidgetItem(fname)
+            if not layer:
+                return
+
+            all_names, numeric_names = self._layer_field_names(layer)
+            self._id_field_combo.addItems(all_names)
+            self._name_field_combo.addItems(all_names)
+
+            # Only show numeric fields in indicator list: one row insertion
+            # for all of them, then make each checkable in place.
+            self._indicator_list.addItems(numeric_names)
+            list_item = self._indicator_list.item
+            for row in range(len(numeric_names)):
+                item = list_item(row)
                 item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(Qt.Unchecked)
-                self._indicator_list.addItem(item)
-        
-        # Check default item (first one)
-        if self._indicator_list.count() > 0:
-            self._indicator_list.item(0).setCheckState(Qt.Checked)
+                # Check default item (first one)
+                item.setCheckState(Qt.Checked if row == 0 else Qt.Unchecked)
+
+            # itemChanged is blocked here, so record the default directly
+            if numeric_names:
+                self._checked_indicators[numeric_names[0]] = 0
+
+    def _layer_field_names(
+        self, layer: QgsVectorLayer
+    ) -> Tuple[List[str], List[str]]:
+        """Return ``(all, numeric)`` field names, cached per layer."""
+        layer_id = layer.id()
+        cached = self._field_cache.get(layer_id)
+        if cached is not None:
+            return cached
+
+        fields = layer.fields()
+        all_names: List[str] = fields.names()
+        numeric = _NUMERIC_FIELD_TYPES
+        numeric_names = [
+            fname
+            for fname, field in zip(all_names, fields)
+            if field.type() in numeric
+        ]
+        cached = self._field_cache[layer_id] = (all_names, numeric_names)
+
+        if layer_id not in self._field_cache_watched:
+            # Adding, removing or renaming a field invalidates the entry
+            slot = partial(self._on_layer_fields_updated, layer_id)
+            layer.updatedFields.connect(slot)
+            self._field_cache_watched[layer_id] = (layer, slot)
+        return cached
+
+    def _on_layer_fields_updated(self, layer_id: str) -> None:
+        """Drop stale field names; refill the combos if the layer is shown."""
+        self._field_cache.pop(layer_id, None)
+        layer = self._last_layer
+        if layer is not None and layer.id() == layer_id:
+            self._last_layer = None
+            self._on_layer_changed(layer)
+
+    def _on_layers_will_be_removed(self, layer_ids: List[str]) -> None:
+        """Drop cached field names of layers leaving the project."""
+        for layer_id in layer_ids:
+            self._field_cache.pop(layer_id, None)
+            self._field_cache_watched.pop(layer_id, None)
+        if self._last_layer is not None and self._last_layer.id() in layer_ids:
+            self._last_layer = None
+
+    def _disconnect_layer_signals(self) -> None:
+        """Detach from the project and every watched layer."""
+        try:
+            QgsProject.instance().layersWillBeRemoved.disconnect(
+                self._on_layers_will_be_removed
+            )
+        except (RuntimeError, TypeError):
+            pass  # already disconnected
+        for layer, slot in self._field_cache_watched.values():
+            try:
+                layer.updatedFields.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass  # layer already deleted
+        self._field_cache_watched.clear()
+
+    def _on_indicator_toggled(self, item: QListWidgetItem) -> None:
+        """Track indicator check state as the user toggles items."""
+        if item.checkState() == Qt.Checked:
+            self._checked_indicators[item.text()] = self._indicator_list.row(item)
+        else:
+            self._checked_indicators.pop(item.text(), None)
+
+    def _checked_indicator_fields(self) -> List[str]:
+        """Return the checked indicator fields in list order."""
+        checked = self._checked_indicators
+        return sorted(checked, key=checked.__getitem__)
 
     # ------------------------------------------------------------------
     # Step 2: Style Configuration
@@ -472,7 +625,6 @@ class WizardDialog(QDialog):
 
         scroll_layout.addWidget(self._grp_gen)
 
-        # 1. Map Styling (Group)
         # 1. Map Styling (Group)
         self._grp_map = QGroupBox(self.tr("Map Styling"))
         map_layout = QVBoxLayout(self._grp_map)
@@ -591,8 +743,9 @@ class WizardDialog(QDialog):
         self._lbl_basemap = QLabel(self.tr("Base Map:"))
         row4.addWidget(self._lbl_basemap)
         self._basemap_combo = QComboBox()
-        for bm in BaseMapType:
-            self._basemap_combo.addItem(bm.value, bm)
+        with self._batch_ui(self._basemap_combo):
+            for label, data in _BASE_MAP_ITEMS:
+                self._basemap_combo.addItem(label, data)
         row4.addWidget(self._basemap_combo)
         map_layout.addLayout(row4)
 
@@ -614,6 +767,11 @@ class WizardDialog(QDialog):
         self._ctx_table.setFixedHeight(120)
         self._ctx_table.verticalHeader().setVisible(False)
         self._ctx_table.setDragDropMode(QTableWidget.NoDragDrop)
+        # Row-ordered mirror of the table, updated as cells are edited so
+        # build_config reads plain Python objects instead of the widgets.
+        self._ctx_rows: List[ContextLayerConfig] = []
+        self._ctx_checked: Set[str] = set()
+        self._ctx_table.itemChanged.connect(self._on_ctx_item_changed)
 
         # Table + reorder buttons side by side
         ctx_row = QHBoxLayout()
@@ -723,8 +881,6 @@ class WizardDialog(QDialog):
         lay_layout.addLayout(row_colors)
 
         scroll_layout.addWidget(self._grp_layout_settings)
-        
-
 
         scroll.setWidget(content)
         layout.addWidget(scroll)
@@ -758,8 +914,10 @@ class WizardDialog(QDialog):
         fmt_layout = QVBoxLayout(self._grp_format)
         self._radio_pdf = QRadioButton("PDF")
         self._radio_pdf.setChecked(True)
+        self._radio_pdf_multi = QRadioButton(self.tr("PDF (single multi-page file)"))
         self._radio_png = QRadioButton("PNG")
         fmt_layout.addWidget(self._radio_pdf)
+        fmt_layout.addWidget(self._radio_pdf_multi)
         fmt_layout.addWidget(self._radio_png)
         
         # DPI
@@ -791,7 +949,7 @@ class WizardDialog(QDialog):
 
         self._progress_label = QLabel("")
         self._progress_label.setVisible(False)
-        self._progress_label.setStyleSheet("font-style: italic; color: gray;")
+        self._progress_label.setStyleSheet(self._PROGRESS_LABEL_QSS)
         layout.addWidget(self._progress_label)
 
         layout.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
@@ -811,7 +969,7 @@ class WizardDialog(QDialog):
 
     def _build_footer(self) -> QWidget:
         footer = QFrame()
-        footer.setStyleSheet("QFrame { border-top: 1px solid palette(mid); padding: 12px; }")
+        footer.setStyleSheet(self._FOOTER_QSS)
         layout = QHBoxLayout(footer)
 
         self._btn_back = QPushButton(self.tr("← Back"))
@@ -822,21 +980,9 @@ class WizardDialog(QDialog):
         layout.addItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum))
 
         self._btn_next = QPushButton(self.tr("Next →"))
-        self._btn_next.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0f3460;
-                color: white;
-                font-weight: bold;
-                padding: 8px 24px;
-                border-radius: 4px;
-                border: none;
-            }
-            QPushButton:hover { background-color: #1a4a7a; }
-            QPushButton:disabled { background-color: #95a5a6; }
-            """
-        )
-        self._btn_next.clicked.connect(self._go_next)
+        self._btn_next.setStyleSheet(self._NEXT_BTN_QSS)
+        # Connected once; _on_next_clicked dispatches on batch state
+        self._btn_next.clicked.connect(self._on_next_clicked)
         layout.addWidget(self._btn_next)
 
         return footer
@@ -922,6 +1068,7 @@ class WizardDialog(QDialog):
         # Step 3
         if hasattr(self, "_lbl_step3_title"): self._lbl_step3_title.setText(f"<h3>{tr['step3_title']}</h3><p>{tr['step3_desc']}</p>")
         if hasattr(self, "_grp_format"): self._grp_format.setTitle(tr["grp_format"])
+        if hasattr(self, "_radio_pdf_multi"): self._radio_pdf_multi.setText(tr["pdf_multipage"])
         if hasattr(self, "_grp_dir"): self._grp_dir.setTitle(tr["grp_dir"])
         if hasattr(self, "_btn_browse"): self._btn_browse.setText(tr["browse"])
 
@@ -940,32 +1087,71 @@ class WizardDialog(QDialog):
         if target < 0 or target >= self._ctx_table.rowCount():
             return
 
-        # Swap all column data between row and target
-        for col in range(self._ctx_table.columnCount()):
-            widget_a = self._ctx_table.cellWidget(row, col)
-            widget_b = self._ctx_table.cellWidget(target, col)
-
-            if widget_a or widget_b:
-                # Spinbox column — swap values
-                val_a = widget_a.value() if widget_a else 1.0
-                val_b = widget_b.value() if widget_b else 1.0
-                if widget_a:
-                    widget_a.setValue(val_b)
-                if widget_b:
-                    widget_b.setValue(val_a)
-            else:
-                # QTableWidgetItem columns — swap items
-                item_a = self._ctx_table.takeItem(row, col)
-                item_b = self._ctx_table.takeItem(target, col)
-                self._ctx_table.setItem(row, col, item_b)
-                self._ctx_table.setItem(target, col, item_a)
-
+        # Whole rows move, so the mirror only needs reordering: keep the
+        # edit handlers quiet while the widgets are shuffled.
+        with self._batch_ui(self._ctx_table):
+            # Swap all column data between row and target
+            for col in range(self._ctx_table.columnCount()):
+                widget_a = self._ctx_table.cellWidget(row, col)
+                widget_b = self._ctx_table.cellWidget(target, col)
+
+                if widget_a or widget_b:
+                    # Spinbox column — swap values
+                    val_a = widget_a.value() if widget_a else 1.0
+                    val_b = widget_b.value() if widget_b else 1.0
+                    if widget_a:
+                        with self._batch_ui(widget_a):
+                            widget_a.setValue(val_b)
+                    if widget_b:
+                        with self._batch_ui(widget_b):
+                            widget_b.setValue(val_a)
+                else:
+                    # QTableWidgetItem columns — swap items
+                    item_a = self._ctx_table.takeItem(row, col)
+                    item_b = self._ctx_table.takeItem(target, col)
+                    self._ctx_table.setItem(row, col, item_b)
+                    self._ctx_table.setItem(target, col, item_a)
+
+        rows = self._ctx_rows
+        rows[row], rows[target] = rows[target], rows[row]
         self._ctx_table.setCurrentCell(target, 0)
 
+    def _on_ctx_item_changed(self, item: QTableWidgetItem) -> None:
+        """Mirror check-state and alias edits into ``_ctx_rows``."""
+        cfg = self._ctx_rows[item.row()]
+        col = item.column()
+        if col == 0:
+            if item.checkState() == Qt.Checked:
+                self._ctx_checked.add(cfg.layer_id)
+            else:
+                self._ctx_checked.discard(cfg.layer_id)
+        elif col == 2:
+            cfg.legend_alias = (item.text() or "").strip()
+
+    def _on_ctx_opacity_changed(self, row: int, value: float) -> None:
+        """Mirror an opacity spinner edit (spinners never change rows)."""
+        self._ctx_rows[row].opacity = value
+
+    def _checked_context_layers(self) -> List[ContextLayerConfig]:
+        """Return configs for the checked context layers in table order."""
+        checked = self._ctx_checked
+        return [
+            ContextLayerConfig(cfg.layer_id, cfg.legend_alias, cfg.opacity)
+            for cfg in self._ctx_rows
+            if cfg.layer_id in checked
+        ]
+
     # ------------------------------------------------------------------
     # Navigation
     # ------------------------------------------------------------------
 
+    def _on_next_clicked(self) -> None:
+        """Advance the wizard, or cancel while a batch is running."""
+        if self._generating:
+            self._controller.cancel_generation()
+        else:
+            self._go_next()
+
     def _go_next(self) -> None:
         if self._current_step == 0:
             is_valid, err_msg = self._controller.validate_step_data()
@@ -974,44 +1160,53 @@ class WizardDialog(QDialog):
                 return
             
             # Prepare Step 2 (Style)
+            self._ensure_page(1)
             layer = self._layer_combo.currentLayer()
             if layer:
                 # 1. Label Field
                 self._label_field_combo.setLayer(layer)
                 
                 # 2. Context Layers — populate table
-                self._ctx_table.setRowCount(0)
-                project = QgsProject.instance()
-                for lyr in project.mapLayers().values():
-                    if lyr.id() == layer.id():
-                        continue
-                    row = self._ctx_table.rowCount()
-                    self._ctx_table.insertRow(row)
-
-                    # Col 0: Checkbox
-                    chk_item = QTableWidgetItem()
-                    chk_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-                    chk_item.setCheckState(Qt.Unchecked)
-                    chk_item.setData(Qt.UserRole, lyr.id())
-                    self._ctx_table.setItem(row, 0, chk_item)
-
-                    # Col 1: Layer name (read-only)
-                    name_item = QTableWidgetItem(lyr.name())
-                    name_item.setFlags(Qt.ItemIsEnabled)
-                    self._ctx_table.setItem(row, 1, name_item)
-
-                    # Col 2: Legend Alias (editable)
-                    alias_item = QTableWidgetItem("")
-                    alias_item.setToolTip(self.tr("Custom name in legend"))
-                    self._ctx_table.setItem(row, 2, alias_item)
-
-                    # Col 3: Opacity spinner
-                    spin = QDoubleSpinBox()
-                    spin.setRange(0.0, 1.0)
-                    spin.setSingleStep(0.1)
-                    spin.setValue(1.0)
-                    spin.setDecimals(1)
-                    self._ctx_table.setCellWidget(row, 3, spin)
+                with self._batch_ui(self._ctx_table):
+                    self._ctx_table.setRowCount(0)
+                    self._ctx_rows = []
+                    self._ctx_checked = set()
+                    project = QgsProject.instance()
+                    for lyr in project.mapLayers().values():
+                        if lyr.id() == layer.id():
+                            continue
+                        row = self._ctx_table.rowCount()
+                        self._ctx_table.insertRow(row)
+
+                        # Col 0: Checkbox
+                        chk_item = QTableWidgetItem()
+                        chk_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+                        chk_item.setCheckState(Qt.Unchecked)
+                        chk_item.setData(Qt.UserRole, lyr.id())
+                        self._ctx_table.setItem(row, 0, chk_item)
+
+                        # Col 1: Layer name (read-only)
+                        name_item = QTableWidgetItem(lyr.name())
+                        name_item.setFlags(Qt.ItemIsEnabled)
+                        self._ctx_table.setItem(row, 1, name_item)
+
+                        # Col 2: Legend Alias (editable)
+                        alias_item = QTableWidgetItem("")
+                        alias_item.setToolTip(self.tr("Custom name in legend"))
+                        self._ctx_table.setItem(row, 2, alias_item)
+
+                        # Col 3: Opacity spinner
+                        spin = QDoubleSpinBox()
+                        spin.setRange(0.0, 1.0)
+                        spin.setSingleStep(0.1)
+                        spin.setValue(1.0)
+                        spin.setDecimals(1)
+                        spin.valueChanged.connect(
+                            partial(self._on_ctx_opacity_changed, row)
+                        )
+                        self._ctx_table.setCellWidget(row, 3, spin)
+
+                        self._ctx_rows.append(ContextLayerConfig(layer_id=lyr.id()))
 
         if self._current_step == 1:
             pass # Style validation is implicitly true
@@ -1021,15 +1216,12 @@ class WizardDialog(QDialog):
             self._btn_next.setText(self.tr("Cancel"))
             self._btn_next.setEnabled(True)
             self._btn_back.setEnabled(False)
-            try:
-                self._btn_next.clicked.disconnect()
-            except TypeError:
-                pass
-            self._btn_next.clicked.connect(self._controller.cancel_generation)
+            self._generating = True
             self._controller.start_generation()
             return
 
         self._current_step += 1
+        self._ensure_page(self._current_step)
         self._stack.setCurrentIndex(self._current_step)
         self._btn_back.setEnabled(True)
 
@@ -1054,14 +1246,15 @@ class WizardDialog(QDialog):
     # ------------------------------------------------------------------
 
     def update_progress(self, current: int, total: int, name: str) -> None:
-        self._progress_bar.setValue(current)
-        self._progress_label.setText(
-            self.tr("Generating: {name} ({current}/{total})").format(
-                name=name,
-                current=current,
-                total=total,
+        with self._batch_ui(self._progress_bar, self._progress_label):
+            self._progress_bar.setValue(current)
+            self._progress_label.setText(
+                self.tr("Generating: {name} ({current}/{total})").format(
+                    name=name,
+                    current=current,
+                    total=total,
+                )
             )
-        )
 
     def _on_batch_complete(self, paths: list, errors: list) -> None:
         """Called when all reports have been processed."""
@@ -1105,11 +1298,7 @@ class WizardDialog(QDialog):
         self._btn_next.setText(self.tr("🚀 Generate"))
         self._btn_next.setEnabled(True)
         self._btn_back.setEnabled(True)
-        try:
-            self._btn_next.clicked.disconnect()
-        except TypeError:
-            pass
-        self._btn_next.clicked.connect(self._go_next)
+        self._generating = False
 
     def _on_preview_clicked(self) -> None:
         """Generate and show a preview of the report."""
@@ -1125,55 +1314,49 @@ class WizardDialog(QDialog):
             id_field = self._id_field_combo.currentText()
             name_field = self._name_field_combo.currentText()
             
-            indicators = []
-            for i in range(self._indicator_list.count()):
-                item = self._indicator_list.item(i)
-                if item.checkState() == Qt.Checked:
-                    indicators.append(item.text())
-            
-            if not indicators:
+            if not self._checked_indicators:
                 QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select at least one indicator."))
                 return
 
+            # build_config also reads the output step's widgets
+            self._ensure_page(2)
             config = self._controller.build_config()
-            
-            # Override for preview (temp dir)
-            from dataclasses import replace
-            config = replace(
-                config, 
-                output_format=OutputFormat.PNG,
-                output_dir=Path(tempfile.gettempdir()),
-                dpi=96
-            )
 
             # 2. Generate
-            from qgis.PyQt.QtWidgets import QApplication
-            
             QApplication.setOverrideCursor(Qt.WaitCursor)
             try:
-                from ..core.report_composer import ReportComposer
-                composer = ReportComposer()
-                # Ensure layer is loaded in data engine
-                # layout generation needs data
-                preview_path = composer.generate_preview(config)
+                composer = self._controller._get_composer()
+                preview_image = composer.generate_preview(config)
             finally:
                 QApplication.restoreOverrideCursor()
 
             # 3. Show Dialog
-            dlg = PreviewDialog(str(preview_path), self)
+            dlg = PreviewDialog(preview_image, self)
             dlg.exec_()
 
         except Exception as exc:
-            import traceback
-            traceback.print_exc()
+            _log.exception("preview failed")
             QMessageBox.critical(self, self.tr("Preview Error"), str(exc))
 
+    # ------------------------------------------------------------------
+    # Overrides
+    # ------------------------------------------------------------------
+
+    def done(self, result: int) -> None:
+        """Disconnect project and layer signals however the dialog closes.
+
+        The dialog is parented to the main window and outlives ``exec_``,
+        so connections left behind would keep firing into it.
+        """
+        self._disconnect_layer_signals()
+        super().done(result)
+
 
 
 class PreviewDialog(QDialog):
     """Dialog to display a generated report preview image."""
 
-    def __init__(self, image_path: str, parent: QWidget = None) -> None:
+    def __init__(self, image: QImage, parent: QWidget = None) -> None:
         super().__init__(parent)
         self.setWindowTitle(self.tr("Report Layout Preview"))
         self.resize(1000, 750)
@@ -1187,7 +1370,7 @@ class PreviewDialog(QDialog):
         self.img_label = QLabel()
         self.img_label.setAlignment(Qt.AlignCenter)
         
-        pixmap = QPixmap(image_path)
+        pixmap = QPixmap.fromImage(image)
         if not pixmap.isNull():
             self.img_label.setPixmap(pixmap)
         else: